@@ -11,14 +11,24 @@ Usage:
     python mdn_waapi_crawler.py --output-dir ./docs       # Custom output directory
     python mdn_waapi_crawler.py --language fr             # French documentation
     python mdn_waapi_crawler.py --max-concurrent 3        # Limit concurrency
+    python mdn_waapi_crawler.py --force                   # Ignore saved ETag/Last-Modified
+    python mdn_waapi_crawler.py --max-age 60              # Resume: skip pages written < 60 min ago
+    python mdn_waapi_crawler.py --force-discovery         # Re-run discovery on unchanged KNOWN_PAGES
 """
 
 import asyncio
+import os
 import sys
 import re
+import time
+import random
+import sqlite3
+import hashlib
 import argparse
+import functools
 from pathlib import Path
-from typing import List, Dict, Set
+from types import MappingProxyType
+from typing import List, Dict, Set, Optional, Mapping
 from urllib.parse import urljoin, urlparse
 from datetime import datetime
 
@@ -32,24 +42,79 @@ try:
 except ImportError:
     print(f"Crawl4AI {MIN_CRAWL4AI_VERSION}+ required")
 
-from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig, CacheMode
+import aiohttp
+from crawl4ai import (
+    AsyncWebCrawler,
+    BrowserConfig,
+    CrawlerRunConfig,
+    CacheMode,
+    SemaphoreDispatcher,
+    RateLimiter,
+)
+
+# One browser configuration shared by every phase (a single crawler is
+# opened in main() and passed down, so Chromium starts once per run)
+BROWSER_CONFIG = BrowserConfig(
+    headless=True,
+    viewport_width=1280,
+    viewport_height=800,
+    verbose=False
+)
+
+# Page content selection for Phase 2: keep only MDN's article and drop the
+# sidebar/TOC divs before markdown conversion (discovery keeps the full
+# page so sidebar links are still found)
+CONTENT_SELECTOR = "article.main-page-content"
+EXCLUDED_SELECTOR = ".document-toc, .sidebar, .page-footer"
+
+# Per-request random delay (seconds) so concurrent fetches to MDN do not
+# fire in synchronized bursts
+REQUEST_JITTER = (0.0, 0.25)
+
+
+def _make_dispatcher(max_concurrent: int) -> SemaphoreDispatcher:
+    """
+    Dispatcher for arun_many that hard-caps in-flight pages at
+    max_concurrent, spaces requests by REQUEST_JITTER and backs off
+    (bounded retries) when the server answers 429/503.
+    """
+    return SemaphoreDispatcher(
+        semaphore_count=max_concurrent,
+        rate_limiter=RateLimiter(base_delay=REQUEST_JITTER, max_delay=30.0, max_retries=2),
+    )
 
 
-def clean_markdown(content: str, title: str = "") -> str:
+async def _jitter() -> None:
+    """Sleep a random REQUEST_JITTER delay before a plain HTTP request."""
+    await asyncio.sleep(random.uniform(*REQUEST_JITTER))
+
+
+# Precompiled patterns (hot paths run these once per line / per URL)
+_HEADING_ANCHOR_RE = re.compile(r'^(#{1,6})\s+\[([^\]]+)\]\([^)]+\)\s*$')
+_LANG_PREFIX_RE = re.compile(r'^/[a-z]{2}(-[A-Z]{2})?/')
+_NORM_LANG_RE = re.compile(r'developer\.mozilla\.org/[a-z]{2}(-[A-Z]{2})?/')
+# Site-relative or absolute MDN hrefs, without query string or fragment
+_HREF_RE = re.compile(r'href="((?:https://developer\.mozilla\.org)?/(?!/)[^"#?]*)')
+
+
+# Line prefixes that continue a Baseline info block
+_BASELINE_CONTINUATIONS = ('  *', 'This feature')
+
+
+def _iter_clean_lines(lines):
     """
-    Clean MDN markdown content:
-    - Remove anchor links from headings
-    - Remove Baseline info block
-    - Remove duplicated title at the start
-    - Remove MDN footer
+    Yield cleaned MDN markdown lines in a single pass.
+
+    Runs of blank lines are collapsed to one blank line as they are
+    emitted, so no post-processing pass over the joined text is needed.
     """
-    lines = content.split('\n')
-    cleaned_lines = []
-    skip_until_next_heading = False
     in_baseline_block = False
     found_first_heading = False
+    blank_streak = 0
+
+    for line in lines:
+        stripped = line.strip()
 
-    for i, line in enumerate(lines):
         # Skip the first H1 heading (duplicated title)
         if not found_first_heading and line.startswith('# '):
             found_first_heading = True
@@ -62,31 +127,42 @@ def clean_markdown(content: str, title: str = "") -> str:
 
         if in_baseline_block:
             # End of baseline block when we hit actual content
-            if line.startswith('#') or (line.strip() and not line.startswith('  *') and not line.startswith('This feature')):
+            if line.startswith('#') or (stripped and not line.startswith(_BASELINE_CONTINUATIONS)):
                 in_baseline_block = False
             else:
                 continue
 
         # Remove MDN footer section
-        if line.strip() == '## Help improve MDN' or line.startswith('## Help improve MDN'):
-            break
+        if stripped == '## Help improve MDN' or line.startswith('## Help improve MDN'):
+            return
+
+        # Collapse runs of blank lines
+        if not line:
+            blank_streak += 1
+            if blank_streak >= 2:
+                continue
+            yield line
+            continue
+        blank_streak = 0
 
         # Clean anchor links from headings: ## [Title](url) -> ## Title
-        heading_match = re.match(r'^(#{1,6})\s+\[([^\]]+)\]\([^)]+\)\s*$', line)
+        heading_match = _HEADING_ANCHOR_RE.match(line) if line[0] == '#' else None
         if heading_match:
-            level = heading_match.group(1)
-            heading_text = heading_match.group(2)
-            cleaned_lines.append(f"{level} {heading_text}")
+            yield f"{heading_match.group(1)} {heading_match.group(2)}"
             continue
 
-        cleaned_lines.append(line)
+        yield line
 
-    # Join and clean up excessive blank lines
-    result = '\n'.join(cleaned_lines)
-    result = re.sub(r'\n{3,}', '\n\n', result)
-    result = result.strip()
 
-    return result
+def clean_markdown(content: str, title: str = "") -> str:
+    """
+    Clean MDN markdown content:
+    - Remove anchor links from headings
+    - Remove Baseline info block
+    - Remove duplicated title at the start
+    - Remove MDN footer
+    """
+    return '\n'.join(_iter_clean_lines(content.splitlines())).strip()
 
 
 # Base URL for MDN
@@ -110,6 +186,9 @@ INCLUDE_PATTERNS = [
     r"/docs/Web/API/Element/getAnimations($|$)",
 ]
 
+# All include patterns fused into one alternation, searched once per link
+_INCLUDE_RE = re.compile("|".join(f"(?:{pattern})" for pattern in INCLUDE_PATTERNS))
+
 # Known pages (pre-compiled list based on MDN structure)
 KNOWN_PAGES = {
     # Main page
@@ -206,13 +285,18 @@ KNOWN_PAGES = {
     "extensions/Element.getAnimations": "/docs/Web/API/Element/getAnimations",
 }
 
+# Reverse index of KNOWN_PAGES: URL path -> file path
+_URL_TO_FILE = {url_path: file_path for file_path, url_path in KNOWN_PAGES.items()}
+
+
+def known_pages_fingerprint() -> str:
+    """Fingerprint of KNOWN_PAGES, used to detect when discovery can be skipped."""
+    return hashlib.blake2b(repr(sorted(KNOWN_PAGES.items())).encode(), digest_size=16).hexdigest()
+
 
 def url_matches_patterns(url: str) -> bool:
     """Check if URL matches any of the include patterns."""
-    for pattern in INCLUDE_PATTERNS:
-        if re.search(pattern, url):
-            return True
-    return False
+    return _INCLUDE_RE.search(url) is not None
 
 
 def get_file_path_from_url(url: str) -> str:
@@ -221,11 +305,14 @@ def get_file_path_from_url(url: str) -> str:
     path = parsed.path
 
     # Remove language prefix
-    path = re.sub(r'^/[a-z]{2}(-[A-Z]{2})?/', '/', path)
+    path = _LANG_PREFIX_RE.sub('/', path)
 
-    # Find matching known page
+    # Find matching known page (exact hit first, suffix scan as fallback)
+    hit = _URL_TO_FILE.get(path)
+    if hit:
+        return hit
     for file_path, url_path in KNOWN_PAGES.items():
-        if path == url_path or path.endswith(url_path):
+        if path.endswith(url_path):
             return file_path
 
     # Fallback: derive from URL path
@@ -242,16 +329,24 @@ def get_file_path_from_url(url: str) -> str:
     return path
 
 
-def build_urls(language: str = "en-US") -> Dict[str, str]:
-    """Build full URLs for all known pages."""
+@functools.lru_cache(maxsize=None)
+def build_urls(language: str = "en-US") -> Mapping[str, str]:
+    """
+    Build full URLs for all known pages.
+    Cached per language; returns a read-only view since it is shared.
+    """
     urls = {}
     for file_path, url_path in KNOWN_PAGES.items():
         full_url = f"{MDN_BASE}/{language}{url_path}"
         urls[file_path] = full_url
-    return urls
+    return MappingProxyType(urls)
 
 
-async def discover_urls(language: str = "en-US", max_concurrent: int = 5) -> Set[str]:
+async def discover_urls(
+    crawler: AsyncWebCrawler,
+    language: str = "en-US",
+    max_concurrent: int = 5,
+) -> Set[str]:
     """
     Phase 1: Discover all relevant URLs by crawling seed pages.
     Returns a set of discovered URLs matching our patterns.
@@ -273,13 +368,6 @@ async def discover_urls(language: str = "en-US", max_concurrent: int = 5) -> Set
 
     discovered: Set[str] = set()
 
-    browser_config = BrowserConfig(
-        headless=True,
-        viewport_width=1280,
-        viewport_height=800,
-        verbose=False
-    )
-
     crawler_config = CrawlerRunConfig(
         cache_mode=CacheMode.BYPASS,
         excluded_tags=["nav", "footer", "aside", "header"],
@@ -287,33 +375,29 @@ async def discover_urls(language: str = "en-US", max_concurrent: int = 5) -> Set
         page_timeout=30000,
     )
 
-    async with AsyncWebCrawler(config=browser_config) as crawler:
-        results = await crawler.arun_many(
-            urls=seed_urls,
-            config=crawler_config,
-            max_concurrent=max_concurrent
-        )
-
-        for result in results:
-            if result.success:
-                discovered.add(result.url)
-                print(f"  Seed: {result.url}")
+    results = await crawler.arun_many(
+        urls=seed_urls,
+        config=crawler_config,
+        dispatcher=_make_dispatcher(max_concurrent),
+    )
 
-                # Extract internal links
-                internal_links = result.links.get('internal', [])
-                for link_info in internal_links:
-                    href = link_info.get('href', '') if isinstance(link_info, dict) else str(link_info)
+    for result in results:
+        if result.success:
+            discovered.add(result.url)
+            print(f"  Seed: {result.url}")
 
-                    # Normalize URL
-                    if href.startswith('/'):
-                        href = f"{MDN_BASE}{href}"
+            # Extract internal links with one regex scan over the page HTML
+            html = result.cleaned_html or result.html or ''
+            for href in set(_HREF_RE.findall(html)):
+                # Normalize URL
+                if href.startswith('/'):
+                    href = f"{MDN_BASE}{href}"
 
-                    # Check if matches our patterns
-                    if url_matches_patterns(href):
-                        # Normalize language
-                        href = re.sub(r'developer\.mozilla\.org/[a-z]{2}(-[A-Z]{2})?/',
-                                     f'developer.mozilla.org/{language}/', href)
-                        discovered.add(href)
+                # Check if matches our patterns
+                if url_matches_patterns(href):
+                    # Normalize language
+                    href = _NORM_LANG_RE.sub(f'developer.mozilla.org/{language}/', href)
+                    discovered.add(href)
 
     # Also add all known pages
     known_urls = build_urls(language)
@@ -324,79 +408,8 @@ async def discover_urls(language: str = "en-US", max_concurrent: int = 5) -> Set
     return discovered
 
 
-async def crawl_pages(urls: List[str], max_concurrent: int = 5) -> Dict[str, dict]:
-    """
-    Phase 2: Crawl all discovered pages and extract content.
-    Returns a dict mapping URL to crawl result data.
-    """
-    print(f"\nPhase 2: Crawling {len(urls)} pages...")
-
-    browser_config = BrowserConfig(
-        headless=True,
-        viewport_width=1280,
-        viewport_height=800,
-        verbose=False
-    )
-
-    crawler_config = CrawlerRunConfig(
-        cache_mode=CacheMode.BYPASS,
-        excluded_tags=["nav", "footer", "aside", "header", "script", "style"],
-        remove_overlay_elements=True,
-        page_timeout=30000,
-        screenshot=False,
-    )
-
-    results_map = {}
-    failed = []
-
-    async with AsyncWebCrawler(config=browser_config) as crawler:
-        # Process in batches to show progress
-        batch_size = max_concurrent * 2
-        url_list = list(urls)
-
-        for i in range(0, len(url_list), batch_size):
-            batch = url_list[i:i + batch_size]
-            print(f"  Batch {i // batch_size + 1}/{(len(url_list) + batch_size - 1) // batch_size}: {len(batch)} URLs")
-
-            batch_results = await crawler.arun_many(
-                urls=batch,
-                config=crawler_config,
-                max_concurrent=max_concurrent
-            )
-
-            for result in batch_results:
-                if result.success:
-                    results_map[result.url] = {
-                        'url': result.url,
-                        'title': result.metadata.get('title', ''),
-                        'description': result.metadata.get('description', ''),
-                        'markdown': result.markdown,
-                        'links': result.links,
-                    }
-                    print(f"    OK: {result.url.split('/')[-1]}")
-                else:
-                    failed.append({
-                        'url': result.url,
-                        'error': result.error_message
-                    })
-                    print(f"    FAIL: {result.url} - {result.error_message}")
-
-    print(f"  Crawled: {len(results_map)} success, {len(failed)} failed")
-
-    if failed:
-        print("\n  Failed URLs:")
-        for f in failed:
-            print(f"    - {f['url']}: {f['error']}")
-
-    return results_map
-
-
-def generate_markdown_files(results: Dict[str, dict], output_dir: Path, language: str):
-    """
-    Phase 3: Generate organized markdown files from crawl results.
-    """
-    print(f"\nPhase 3: Generating markdown files in {output_dir}...")
-
+def _prepare_output_dirs(output_dir: Path) -> None:
+    """Create the output directory tree."""
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # Create subdirectories
@@ -413,88 +426,379 @@ def generate_markdown_files(results: Dict[str, dict], output_dir: Path, language
     for interface in interfaces:
         (output_dir / "interfaces" / interface).mkdir(exist_ok=True)
 
-    files_written = 0
-    index_entries = {
+
+def _new_index_entries() -> dict:
+    """Return an empty index entries structure."""
+    return {
         'main': [],
         'guides': [],
         'interfaces': {},
         'extensions': []
     }
 
-    known_urls = build_urls(language)
 
-    for file_path, url in known_urls.items():
-        if url not in results:
-            print(f"  SKIP (not crawled): {file_path}")
-            continue
+def _page_location(file_path: str) -> tuple:
+    """
+    Map a KNOWN_PAGES file path to its output location.
+    Returns (relative output path, index section, interface name or None).
+    """
+    if file_path == "Web_Animations_API":
+        return "Web_Animations_API.md", 'main', None
+    if file_path.startswith("guides/"):
+        name = file_path.replace("guides/", "")
+        return f"guides/{name}.md", 'guides', None
+    if file_path.startswith("interfaces/"):
+        parts = file_path.replace("interfaces/", "").split("/")
+        interface_name = parts[0]
+        page_name = parts[1] if len(parts) > 1 else "index"
+        return f"interfaces/{interface_name}/{page_name}.md", 'interfaces', interface_name
+    if file_path.startswith("extensions/"):
+        name = file_path.replace("extensions/", "")
+        return f"extensions/{name}.md", 'extensions', None
+    # Fallback (not listed in the index)
+    safe_name = file_path.replace("/", "_")
+    return f"{safe_name}.md", None, None
+
+
+def _add_index_entry(index_entries: dict, file_path: str, title: str) -> str:
+    """Record a page in the index entries. Returns its relative output path."""
+    rel_path, section, interface_name = _page_location(file_path)
+    if section == 'interfaces':
+        index_entries['interfaces'].setdefault(interface_name, []).append((title, rel_path))
+    elif section:
+        index_entries[section].append((title, rel_path))
+    return rel_path
+
+
+# Frontmatter + body layout of every generated page
+_PAGE_TEMPLATE = '---\ntitle: "{title}"\nurl: "{url}"\ncrawled_at: "{ts}"\n---\n\n# {title}\n\n{body}\n'
+
+
+def _write_page(
+    output_dir: Path,
+    file_path: str,
+    url: str,
+    title: str,
+    markdown_content: str,
+    index_entries: Optional[dict] = None,
+    crawled_at: Optional[str] = None,
+) -> tuple:
+    """
+    Clean one crawled page, write it to disk and, if index_entries is
+    given, record it in the index. Returns (cleaned title, written path).
 
-        result = results[url]
-        markdown_content = result['markdown']
-        title = result['title'] or file_path.split('/')[-1]
+    crawled_at is the run timestamp shared by every page of a crawl;
+    it defaults to the current time.
+    """
+    title = title or file_path.split('/')[-1]
 
-        # Clean up title (remove " - Web APIs | MDN" suffix)
-        title = re.sub(r'\s*[-|].*MDN.*$', '', title)
-        title = re.sub(r'\s*[-|]\s*Web APIs.*$', '', title)
+    # Clean up title (remove " - Web APIs | MDN" suffix)
+    # MDN titles are always "<name> - Web APIs | MDN"; split, no regex
+    title = title.split(' | ')[0].split(' - Web APIs')[0].strip()
 
-        # Clean the markdown content
-        markdown_content = clean_markdown(markdown_content, title)
+    # Clean the markdown content
+    markdown_content = clean_markdown(markdown_content, title)
 
-        # Build file content with frontmatter
-        content = f"""---
-title: "{title}"
-url: "{url}"
-crawled_at: "{datetime.now().isoformat()}"
----
+    # Build file content with frontmatter
+    content = _PAGE_TEMPLATE.format_map({
+        'title': title,
+        'url': url,
+        'ts': crawled_at or datetime.now().isoformat(),
+        'body': markdown_content,
+    })
 
-# {title}
+    if index_entries is not None:
+        out_path = output_dir / _add_index_entry(index_entries, file_path, title)
+    else:
+        out_path = output_dir / _page_location(file_path)[0]
+    out_path.write_text(content, encoding='utf-8')
+    print(f"  Written: {out_path.relative_to(output_dir)}")
+    return title, out_path
 
-{markdown_content}
-"""
 
-        # Determine output file path
-        if file_path == "Web_Animations_API":
-            out_path = output_dir / "Web_Animations_API.md"
-            index_entries['main'].append((title, "Web_Animations_API.md"))
-        elif file_path.startswith("guides/"):
-            name = file_path.replace("guides/", "")
-            out_path = output_dir / "guides" / f"{name}.md"
-            index_entries['guides'].append((title, f"guides/{name}.md"))
-        elif file_path.startswith("interfaces/"):
-            parts = file_path.replace("interfaces/", "").split("/")
-            interface_name = parts[0]
-            page_name = parts[1] if len(parts) > 1 else "index"
-            out_path = output_dir / "interfaces" / interface_name / f"{page_name}.md"
-
-            if interface_name not in index_entries['interfaces']:
-                index_entries['interfaces'][interface_name] = []
-            index_entries['interfaces'][interface_name].append(
-                (title, f"interfaces/{interface_name}/{page_name}.md")
-            )
-        elif file_path.startswith("extensions/"):
-            name = file_path.replace("extensions/", "")
-            out_path = output_dir / "extensions" / f"{name}.md"
-            index_entries['extensions'].append((title, f"extensions/{name}.md"))
-        else:
-            # Fallback
-            safe_name = file_path.replace("/", "_")
-            out_path = output_dir / f"{safe_name}.md"
+class PageStore:
+    """
+    SQLite store of per-page crawl metadata in output_dir/.cache/pages.db.
+
+    Rows (ETag, Last-Modified, cleaned title, KNOWN_PAGES file path and
+    crawl timestamp) are committed as each page is written, so an
+    interrupted run keeps everything written so far and the next run can
+    resume from it.
+    """
+
+    def __init__(self, output_dir: Path):
+        db_path = output_dir / ".cache" / "pages.db"
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            "url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, "
+            "title TEXT, file_path TEXT, ts REAL)"
+        )
+        self.conn.commit()
+
+    def get(self, url: str) -> Optional[dict]:
+        """Return the stored entry for a URL, or None."""
+        row = self.conn.execute(
+            "SELECT etag, last_modified, title, file_path, ts FROM pages WHERE url = ?",
+            (url,),
+        ).fetchone()
+        if row is None:
+            return None
+        return dict(zip(('etag', 'last_modified', 'title', 'file_path', 'ts'), row))
+
+    def put(
+        self,
+        url: str,
+        file_path: str,
+        title: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """Insert or replace the entry for a URL and commit it."""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?)",
+            (url, etag, last_modified, title, file_path, time.time()),
+        )
+        self.conn.commit()
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+async def filter_unchanged(
+    urls: List[str],
+    store: PageStore,
+    output_dir: Path,
+    max_concurrent: int = 5,
+    max_age: Optional[float] = None,
+) -> tuple:
+    """
+    Drop URLs whose output file exists and that are known to be unchanged:
+    stored less than max_age seconds ago (no request at all), or reported
+    unchanged by a conditional HEAD (If-None-Match / If-Modified-Since)
+    returning 304 or the same ETag/Last-Modified.
+    Returns (urls_to_crawl, unchanged_urls).
+    """
+    semaphore = asyncio.Semaphore(max_concurrent)
+    fresh_after = time.time() - max_age if max_age else None
+
+    async def is_unchanged(session: aiohttp.ClientSession, url: str) -> bool:
+        entry = store.get(url)
+        if not entry:
+            return False
+        rel_path, _, _ = _page_location(entry['file_path'])
+        if not (output_dir / rel_path).exists():
+            return False
+        if fresh_after is not None and entry['ts'] >= fresh_after:
+            return True
+        if not (entry.get('etag') or entry.get('last_modified')):
+            return False
+
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+
+        async with semaphore:
+            await _jitter()
+            try:
+                async with session.head(url, headers=headers, allow_redirects=True) as resp:
+                    if resp.status == 304:
+                        return True
+                    etag = resp.headers.get('ETag')
+                    last_modified = resp.headers.get('Last-Modified')
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                return False
+
+        if etag and etag == entry.get('etag'):
+            return True
+        return bool(last_modified) and last_modified == entry.get('last_modified')
+
+    print(f"\nChecking {len(urls)} URLs for changes (conditional HEAD)...")
+
+    url_list = list(urls)
+    async with aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=max_concurrent, limit_per_host=max_concurrent),
+        timeout=aiohttp.ClientTimeout(total=10),
+    ) as session:
+        flags = await asyncio.gather(*(is_unchanged(session, url) for url in url_list))
+
+    to_crawl = [url for url, unchanged in zip(url_list, flags) if not unchanged]
+    unchanged = [url for url, unchanged in zip(url_list, flags) if unchanged]
+    print(f"  {len(unchanged)} unchanged, {len(to_crawl)} to crawl")
+    return to_crawl, unchanged
+
 
-        out_path.write_text(content, encoding='utf-8')
+# Server-rendered MDN pages carry their content in this article; its presence
+# means the static HTML is complete and no browser rendering is needed.
+_STATIC_CONTENT_MARKER = 'main-page-content'
+
+
+async def _fetch_static_pages(urls: List[str], max_concurrent: int = 5) -> Dict[str, tuple]:
+    """
+    Fetch pages with plain HTTP GETs (no browser).
+    Returns a dict mapping URL to (html, response headers) for every page
+    whose static HTML already contains the MDN main content.
+    """
+    semaphore = asyncio.Semaphore(max_concurrent)
+    pages = {}
+
+    async def fetch(session: aiohttp.ClientSession, url: str) -> None:
+        async with semaphore:
+            await _jitter()
+            try:
+                async with session.get(url, allow_redirects=True) as resp:
+                    if resp.status != 200:
+                        return
+                    html = await resp.text()
+                    headers = {k.lower(): v for k, v in resp.headers.items()}
+            except (aiohttp.ClientError, asyncio.TimeoutError, UnicodeDecodeError):
+                return
+        if _STATIC_CONTENT_MARKER in html:
+            pages[url] = (html, headers)
+
+    async with aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=max_concurrent, limit_per_host=max_concurrent),
+        timeout=aiohttp.ClientTimeout(total=30),
+    ) as session:
+        await asyncio.gather(*(fetch(session, url) for url in urls))
+
+    return pages
+
+
+async def crawl_and_write(
+    crawler: AsyncWebCrawler,
+    urls: List[str],
+    output_dir: Path,
+    language: str = "en-US",
+    max_concurrent: int = 5,
+    store: Optional[PageStore] = None,
+    unchanged_urls: Optional[List[str]] = None,
+    static_first: bool = True,
+) -> tuple:
+    """
+    Phases 2+3 pipelined: crawl pages and write each one to disk as soon
+    as its result arrives, so disk writes overlap with network latency and
+    only one page of markdown is held in memory at a time.
+
+    With static_first, pages are first fetched over plain HTTP; those whose
+    HTML already holds the main content are converted from raw:// HTML
+    (no page navigation) and only the rest go through the browser.
+
+    If a store is given, each written page's ETag/Last-Modified is
+    recorded in it as soon as the page is written; unchanged_urls (skipped
+    by filter_unchanged) are listed in the index from their stored entries.
+    Returns (pages_crawled, files_written).
+    """
+    print(f"\nPhase 2+3: Crawling {len(urls)} pages into {output_dir}...")
+
+    _prepare_output_dirs(output_dir)
+
+    crawler_config = CrawlerRunConfig(
+        cache_mode=CacheMode.BYPASS,
+        excluded_tags=["nav", "footer", "aside", "header", "script", "style"],
+        css_selector=CONTENT_SELECTOR,
+        excluded_selector=EXCLUDED_SELECTOR,
+        remove_overlay_elements=True,
+        page_timeout=30000,
+        screenshot=False,
+        stream=True,
+    )
+
+    url_to_file = {url: file_path for file_path, url in build_urls(language).items()}
+    index_entries = _new_index_entries()
+    crawled_at = datetime.now().isoformat()
+
+    # Pages skipped as unchanged keep their existing file; just index them
+    for url in unchanged_urls or ():
+        entry = store.get(url)
+        _add_index_entry(index_entries, entry['file_path'], entry['title'])
+
+    # Lightweight path: static HTML fed to Crawl4AI as raw:// input
+    crawl_targets = list(urls)
+    origins = {}  # raw:// target -> (original URL, HTTP headers)
+    if static_first and crawl_targets:
+        static_pages = await _fetch_static_pages(crawl_targets, max_concurrent)
+        print(f"  Static HTML: {len(static_pages)} pages, "
+              f"browser: {len(crawl_targets) - len(static_pages)} pages")
+        crawl_targets = [url for url in crawl_targets if url not in static_pages]
+        for url, (html, headers) in static_pages.items():
+            raw_target = f"raw://{html}"
+            origins[raw_target] = (url, headers)
+            crawl_targets.append(raw_target)
+        del static_pages
+
+    pages_crawled = 0
+    files_written = 0
+    failed = []
+
+    async for result in await crawler.arun_many(
+        urls=crawl_targets,
+        config=crawler_config,
+        dispatcher=_make_dispatcher(max_concurrent),
+    ):
+        url, headers = origins.pop(result.url, (result.url, result.response_headers))
+
+        if not result.success:
+            failed.append({
+                'url': url,
+                'error': result.error_message
+            })
+            print(f"  FAIL: {url} - {result.error_message}")
+            continue
+
+        pages_crawled += 1
+        file_path = url_to_file.get(url)
+        if not file_path:
+            print(f"  SKIP (unknown page): {url}")
+            continue
+
+        # Clean + write off the event loop so in-flight crawls keep running
+        title, _ = await asyncio.to_thread(
+            _write_page,
+            output_dir,
+            file_path,
+            url,
+            result.metadata.get('title', ''),
+            result.markdown,
+            index_entries,
+            crawled_at,
+        )
         files_written += 1
-        print(f"  Written: {out_path.relative_to(output_dir)}")
+
+        if store is not None:
+            headers = headers or {}
+            store.put(
+                url,
+                file_path,
+                title,
+                etag=headers.get('etag'),
+                last_modified=headers.get('last-modified'),
+            )
+
+    print(f"  Crawled: {pages_crawled} success, {len(failed)} failed")
+
+    if failed:
+        print("\n  Failed URLs:")
+        for f in failed:
+            print(f"    - {f['url']}: {f['error']}")
 
     # Generate index.md
-    generate_index(output_dir, index_entries)
+    generate_index(output_dir, index_entries, crawled_at)
     files_written += 1
 
     print(f"  Total files written: {files_written}")
-    return files_written
+    return pages_crawled, files_written
 
 
-def generate_index(output_dir: Path, entries: dict):
+def generate_index(output_dir: Path, entries: dict, generated_at: Optional[str] = None):
     """Generate index.md with table of contents."""
 
-    content = """---
+    parts: List[str] = ["""---
 title: "MDN Web Animations API Documentation"
 generated_at: "{date}"
 ---
@@ -505,40 +809,40 @@ This documentation was extracted from the Mozilla Developer Network (MDN).
 
 ## Table of Contents
 
-""".format(date=datetime.now().isoformat())
+""".format(date=generated_at or datetime.now().isoformat())]
 
     # Main page
     if entries['main']:
-        content += "### Overview\n\n"
-        for title, path in entries['main']:
-            content += f"- [{title}]({path})\n"
-        content += "\n"
+        parts.append("### Overview\n\n")
+        parts.extend(f"- [{title}]({path})\n" for title, path in entries['main'])
+        parts.append("\n")
 
     # Guides
     if entries['guides']:
-        content += "### Guides\n\n"
-        for title, path in sorted(entries['guides']):
-            content += f"- [{title}]({path})\n"
-        content += "\n"
+        parts.append("### Guides\n\n")
+        parts.extend(f"- [{title}]({path})\n" for title, path in sorted(entries['guides']))
+        parts.append("\n")
 
     # Interfaces
     if entries['interfaces']:
-        content += "### Interfaces\n\n"
+        parts.append("### Interfaces\n\n")
         for interface_name in sorted(entries['interfaces'].keys()):
             pages = entries['interfaces'][interface_name]
-            content += f"#### {interface_name}\n\n"
-            for title, path in sorted(pages, key=lambda x: (x[1] != f"interfaces/{interface_name}/index.md", x[0])):
-                content += f"- [{title}]({path})\n"
-            content += "\n"
+            index_path = f"interfaces/{interface_name}/index.md"
+            parts.append(f"#### {interface_name}\n\n")
+            parts.extend(
+                f"- [{title}]({path})\n"
+                for title, path in sorted(pages, key=lambda x: (x[1] != index_path, x[0]))
+            )
+            parts.append("\n")
 
     # Extensions
     if entries['extensions']:
-        content += "### Document and Element Extensions\n\n"
-        for title, path in sorted(entries['extensions']):
-            content += f"- [{title}]({path})\n"
-        content += "\n"
+        parts.append("### Document and Element Extensions\n\n")
+        parts.extend(f"- [{title}]({path})\n" for title, path in sorted(entries['extensions']))
+        parts.append("\n")
 
-    (output_dir / "index.md").write_text(content, encoding='utf-8')
+    (output_dir / "index.md").write_text("".join(parts), encoding='utf-8')
     print(f"  Written: index.md")
 
 
@@ -573,6 +877,27 @@ async def main():
         action="store_true",
         help="Skip URL discovery, use only known pages list"
     )
+    parser.add_argument(
+        "--force-discovery",
+        action="store_true",
+        help="Run URL discovery even if KNOWN_PAGES is unchanged since the last run"
+    )
+    parser.add_argument(
+        "--browser-only",
+        action="store_true",
+        help="Render every page in the browser (skip the static HTML fast path)"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-crawl every page, ignoring saved ETag/Last-Modified validators"
+    )
+    parser.add_argument(
+        "--max-age",
+        type=float,
+        metavar="MINUTES",
+        help="Skip pages written less than MINUTES ago (resume an interrupted run)"
+    )
 
     args = parser.parse_args()
 
@@ -584,35 +909,65 @@ async def main():
     print(f"Max concurrent: {args.max_concurrent}")
     print("=" * 60)
 
-    # Phase 1: Discover URLs
-    if args.skip_discovery:
-        known_urls = build_urls(args.language)
-        urls = set(known_urls.values())
-        print(f"\nUsing {len(urls)} known URLs (discovery skipped)")
-    else:
-        urls = await discover_urls(args.language, args.max_concurrent)
-
-    if args.discover_only:
-        print(f"\n{'=' * 60}")
-        print(f"Discovered {len(urls)} URLs:")
-        print("=" * 60)
-        for url in sorted(urls):
-            print(f"  {url}")
-        print(f"\nTotal: {len(urls)} URLs")
-        return
-
-    # Phase 2: Crawl pages
-    results = await crawl_pages(list(urls), args.max_concurrent)
-
-    # Phase 3: Generate files
     output_dir = Path(args.output_dir)
-    files_written = generate_markdown_files(results, output_dir, args.language)
+
+    # Only KNOWN_PAGES are written, so once discovery has run against the
+    # current list it can be skipped until the list changes
+    fingerprint = known_pages_fingerprint()
+    fingerprint_file = output_dir / ".known_fingerprint"
+    skip_discovery = args.skip_discovery
+    if (not skip_discovery and not args.discover_only and not args.force_discovery
+            and fingerprint_file.exists()
+            and fingerprint_file.read_text(encoding='utf-8').strip() == fingerprint):
+        skip_discovery = True
+        print("\nKNOWN_PAGES unchanged since last discovery (use --force-discovery to re-run)")
+
+    # One browser for every phase
+    async with AsyncWebCrawler(config=BROWSER_CONFIG) as crawler:
+        # Phase 1: Discover URLs
+        if skip_discovery:
+            known_urls = build_urls(args.language)
+            urls = set(known_urls.values())
+            print(f"\nUsing {len(urls)} known URLs (discovery skipped)")
+        else:
+            urls = await discover_urls(crawler, args.language, args.max_concurrent)
+            output_dir.mkdir(parents=True, exist_ok=True)
+            fingerprint_file.write_text(fingerprint, encoding='utf-8')
+
+        if args.discover_only:
+            print(f"\n{'=' * 60}")
+            print(f"Discovered {len(urls)} URLs:")
+            print("=" * 60)
+            for url in sorted(urls):
+                print(f"  {url}")
+            print(f"\nTotal: {len(urls)} URLs")
+            return
+
+        store = PageStore(output_dir)
+        try:
+            # Skip pages crawled recently or reported unchanged by the server
+            to_crawl, unchanged = list(urls), []
+            if not args.force:
+                max_age = args.max_age * 60 if args.max_age else None
+                to_crawl, unchanged = await filter_unchanged(
+                    to_crawl, store, output_dir, args.max_concurrent, max_age
+                )
+
+            # Phases 2+3: Crawl pages and write files as results arrive
+            pages_crawled, files_written = await crawl_and_write(
+                crawler, to_crawl, output_dir, args.language, args.max_concurrent,
+                store=store, unchanged_urls=unchanged,
+                static_first=not args.browser_only,
+            )
+        finally:
+            store.close()
 
     print(f"\n{'=' * 60}")
     print("Crawl Complete!")
     print("=" * 60)
     print(f"URLs discovered: {len(urls)}")
-    print(f"Pages crawled: {len(results)}")
+    print(f"Pages crawled: {pages_crawled}")
+    print(f"Pages unchanged: {len(unchanged)}")
     print(f"Files written: {files_written}")
     print(f"Output directory: {output_dir.absolute()}")
 
@@ -7,6 +7,7 @@ Crawl documentation sources defined in the sources/ directory.
 Usage:
     python crawl.py <source-name>                    # Full crawl
     python crawl.py <source-name> --discover-only    # List URLs only
+    python crawl.py <source-name> --force            # Re-crawl and regenerate every page
     python crawl.py <source-name> --check            # Check local files for changes
     python crawl.py <source-name> --check-remote     # Check remote for changes
     python crawl.py --list                           # List available sources
@@ -14,30 +15,104 @@ Usage:
 """
 
 import asyncio
+import os
 import sys
 import re
 import argparse
+import functools
 import importlib.util
+import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
+from urllib.parse import urlparse
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 # Add project root to path for imports
 PROJECT_ROOT = Path(__file__).parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from crawl4ai_toolkit import discover_urls, crawl_pages, CleanerBase
-from crawl4ai_toolkit.generator import generate_markdown_files, generate_index
+from crawl4ai_toolkit import discover_urls, crawl_pages, crawl_session, CleanerBase
+from crawl4ai_toolkit.crawler import compile_url_patterns
+from crawl4ai_toolkit.generator import generate_markdown_files, generate_index, generation_fingerprint
 from crawl4ai_toolkit.state import (
     CrawlState,
-    check_local_file,
+    check_local_files_parallel,
     check_page_changed,
     print_change_report,
     ChangeResult,
+    compute_page_hash,
+    compute_raw_hash,
+    hash_algorithm,
 )
 
 
+@functools.lru_cache(maxsize=64)
+def _parse_yaml(path: str, mtime_ns: int) -> dict:
+    """Parse a YAML file (cached per path and modification time)."""
+    with open(path) as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+def _load_yaml(path: Path) -> dict:
+    """Load a YAML file, reusing the parsed result while it is unchanged."""
+    return _parse_yaml(str(path), path.stat().st_mtime_ns)
+
+
+def _load_config(config_path: Path) -> dict:
+    """
+    Load a source config.yaml through a JSON copy kept next to it.
+
+    The copy (.config.cache.json) is used while it is at least as recent
+    as config.yaml, skipping YAML parsing on repeated CLI runs; otherwise
+    the YAML is parsed and the copy rewritten.
+    """
+    cache_path = config_path.with_name(".config.cache.json")
+    try:
+        if cache_path.stat().st_mtime_ns >= config_path.stat().st_mtime_ns:
+            with open(cache_path, encoding='utf-8') as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    config = _load_yaml(config_path)
+    try:
+        data = json.dumps(config, ensure_ascii=False)
+        # Only cache configs that survive a JSON round trip unchanged
+        # (YAML dates or non-string keys would not)
+        if json.loads(data) == config:
+            cache_path.write_text(data, encoding='utf-8')
+    except (TypeError, ValueError, OSError):
+        pass
+    return config
+
+
+@dataclass
+class SourceInfo:
+    """A source directory; its config is only parsed when first needed."""
+    name: str
+    config_path: Path
+
+    @functools.cached_property
+    def config(self) -> dict:
+        return _load_config(self.config_path)
+
+    @property
+    def title(self) -> str:
+        return self.config.get('name', self.name)
+
+    @property
+    def base_url(self) -> str:
+        return self.config.get('base_url', '')
+
+
 def list_sources() -> list:
     """List all available sources in the sources/ directory."""
     sources_dir = PROJECT_ROOT / "sources"
@@ -45,32 +120,47 @@ def list_sources() -> list:
         return []
 
     sources = []
-    for source_dir in sources_dir.iterdir():
-        if source_dir.is_dir():
-            config_file = source_dir / "config.yaml"
-            if config_file.exists():
-                with open(config_file) as f:
-                    config = yaml.safe_load(f)
-                sources.append({
-                    'name': source_dir.name,
-                    'title': config.get('name', source_dir.name),
-                    'base_url': config.get('base_url', ''),
-                })
+    with os.scandir(sources_dir) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                config_file = Path(entry.path) / "config.yaml"
+                if config_file.exists():
+                    sources.append(SourceInfo(entry.name, config_file))
     return sources
 
 
 def load_source_config(source_name: str) -> dict:
-    """Load configuration for a source."""
+    """
+    Load configuration for a source.
+
+    Not cached here: _load_config's JSON copy and the YAML parse cache are
+    keyed on config.yaml's modification time, so edits are always seen.
+    """
     config_path = PROJECT_ROOT / "sources" / source_name / "config.yaml"
     if not config_path.exists():
         raise FileNotFoundError(f"Source '{source_name}' not found. Config: {config_path}")
 
-    with open(config_path) as f:
-        return yaml.safe_load(f)
+    return _load_config(config_path)
+
+
+def _load_module_from_path(module_name: str, path: Path):
+    """
+    Import a source module from its file path.
+
+    spec_from_file_location uses SourceFileLoader, which reads and writes
+    compiled bytecode in __pycache__ like a regular import, without putting
+    the source directory on sys.path (sources share module names).
+    """
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
 
 
-def load_source_cleaner(source_name: str, config: dict) -> CleanerBase:
-    """Load the cleaner for a source."""
+@functools.lru_cache(maxsize=32)
+def load_source_cleaner(source_name: str) -> CleanerBase:
+    """Load the cleaner for a source (cached per source)."""
+    config = load_source_config(source_name)
     cleaner_config = config.get('cleaner', {})
     module_name = cleaner_config.get('module')
 
@@ -85,9 +175,7 @@ def load_source_cleaner(source_name: str, config: dict) -> CleanerBase:
         print(f"  Warning: Cleaner module not found: {cleaner_path}")
         return CleanerBase()
 
-    spec = importlib.util.spec_from_file_location(module_name, cleaner_path)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
+    module = _load_module_from_path(module_name, cleaner_path)
 
     # Look for a class ending in 'Cleaner'
     for attr_name in dir(module):
@@ -100,18 +188,128 @@ def load_source_cleaner(source_name: str, config: dict) -> CleanerBase:
     return CleanerBase()
 
 
+@functools.lru_cache(maxsize=32)
 def load_url_mappings(source_name: str):
-    """Load URL mappings module for a source."""
+    """Load URL mappings module for a source (cached per source)."""
     source_dir = PROJECT_ROOT / "sources" / source_name
     mappings_path = source_dir / "url_mappings.py"
 
     if not mappings_path.exists():
         return None
 
-    spec = importlib.util.spec_from_file_location("url_mappings", mappings_path)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
+    return _load_module_from_path("url_mappings", mappings_path)
+
+
+def _url_path(url: str) -> str:
+    """Fallback URL to file path mapping: the URL path, keeping slashes."""
+    return urlparse(url).path.strip('/')
+
+
+def _make_url_to_filepath(mappings_module) -> Callable[[str], str]:
+    """Return the URL to file path function for a source."""
+    if mappings_module and hasattr(mappings_module, 'get_file_path_from_url'):
+        return mappings_module.get_file_path_from_url
+    return _url_path
+
+
+def _make_normalize_url(mappings_module) -> Optional[Callable[[str, str], str]]:
+    """Return the URL normalization function for a source, if it has one."""
+    if mappings_module and hasattr(mappings_module, 'normalize_mdn_url'):
+        return mappings_module.normalize_mdn_url
+    return None
+
+
+def _make_clean_title(title_pattern: Optional[str]) -> Callable[[str], str]:
+    """Return a title cleaner removing title_pattern (if set) and outer whitespace."""
+    if not title_pattern:
+        return str.strip
+
+    suffix_re = re.compile(title_pattern)
+
+    def clean_title(title: str) -> str:
+        return suffix_re.sub('', title).strip()
+
+    return clean_title
+
+
+def _settings_fingerprint(source_name: str, config: dict) -> str:
+    """
+    Describe the source settings that shape its generated pages.
+
+    Covers the config and the code of the source's cleaner and URL mapping
+    modules, so editing any of them regenerates pages whose raw crawl
+    output did not change.
+    """
+    source_dir = PROJECT_ROOT / "sources" / source_name
+    parts = [json.dumps(config, sort_keys=True, default=str)]
+    module_name = config.get('cleaner', {}).get('module')
+    module_paths = [source_dir / f"{module_name}.py"] if module_name else []
+    module_paths.append(source_dir / "url_mappings.py")
+    for path in module_paths:
+        try:
+            parts.append(path.read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            pass
+    return "\n".join(parts)
+
+
+def _process_page(
+    url: str,
+    file_path: str,
+    crawl_result: dict,
+    saved_pages: dict,
+    cleaner: CleanerBase,
+    clean_title: Callable[[str], str],
+    fingerprint: str = "",
+) -> ChangeResult:
+    """
+    Clean and hash one crawled page and compare it with its saved state.
+
+    fingerprint is the generation_fingerprint mixed into saved raw hashes.
+
+    Returns:
+        ChangeResult for the page
+    """
+    # Server confirmed the page unchanged via a conditional request
+    if crawl_result.get('unchanged'):
+        return ChangeResult(url, file_path, 'unchanged', crawl_result['unchanged'])
+
+    markdown_content = crawl_result.get('markdown', '')
+    title = crawl_result.get('title', '')
+    saved_state = saved_pages.get(file_path)
+
+    # Raw page identical to the last written one: no need to clean it
+    saved_raw_hash = saved_state.get('raw_hash') if saved_state is not None else None
+    if saved_raw_hash and (
+        compute_raw_hash(markdown_content, title, hash_algorithm(saved_raw_hash), fingerprint) == saved_raw_hash
+    ):
+        return ChangeResult(url, file_path, 'unchanged', 'raw_hash')
+
+    # Clean content same way as generator
+    title = clean_title(title or file_path.split('/')[-1])
+    markdown_content = cleaner.clean(markdown_content, title)
+
+    # Compute hash the same way as generator
+    if saved_state is None:
+        return ChangeResult(url, file_path, 'new', 'new_page')
+
+    saved_hash = saved_state.get('content_hash')
+    new_hash = compute_page_hash(title, markdown_content, hash_algorithm(saved_hash))
+    if new_hash != saved_hash:
+        return ChangeResult(url, file_path, 'changed', 'content_hash')
+    return ChangeResult(url, file_path, 'unchanged', 'content_hash')
+
+
+def _walk_md(root: str):
+    """Yield paths of all .md files under root except index.md files."""
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith('.md') and entry.name != 'index.md':
+                    yield entry.path
 
 
 async def check_local(source_name: str) -> None:
@@ -130,19 +328,17 @@ async def check_local(source_name: str) -> None:
         print(f"No saved state for {source_name}. Run a crawl first.")
         return
 
-    results = []
+    pages = state.get_all_pages()
 
-    for file_path, page_state in state.get_all_pages().items():
-        result = check_local_file(output_dir, file_path, page_state)
-        results.append(result)
+    # One result per saved page; files are read and hashed in parallel
+    results = check_local_files_parallel(output_dir, pages)
 
     # Check for new files not in state
     if output_dir.exists():
-        for md_file in output_dir.rglob("*.md"):
-            if md_file.name == "index.md":
-                continue
-            rel_path = str(md_file.relative_to(output_dir))[:-3]  # Remove .md
-            if rel_path not in state.get_all_pages():
+        root = str(output_dir)
+        for md_path in _walk_md(root):
+            rel_path = md_path[len(root) + 1:-3]  # Remove output_dir/ and .md
+            if rel_path not in pages:
                 results.append(ChangeResult(
                     url="",
                     file_path=rel_path,
@@ -195,101 +391,92 @@ async def check_remote(
         f"{base_url}{url}" for url in config.get('seed_urls', [])
     ]
 
-    # Define URL normalization function
-    def normalize_url(url: str, language: str) -> str:
-        if mappings_module and hasattr(mappings_module, 'normalize_mdn_url'):
-            return mappings_module.normalize_mdn_url(url, language)
-        return url
+    # URL normalization and URL to file path functions
+    normalize_url = _make_normalize_url(mappings_module)
+    url_to_filepath = _make_url_to_filepath(mappings_module)
 
-    # Discover URLs
-    urls = await discover_urls(
-        seed_urls=seed_urls,
-        include_patterns=config.get('include_patterns', []),
-        base_url=base_url,
-        language=lang,
-        max_concurrent=concurrent,
-        page_timeout=page_timeout,
-        excluded_tags=excluded_tags,
-        normalize_url=normalize_url,
-        exclude_patterns=config.get('exclude_patterns'),
-        depth=discovery_depth,
-    )
+    # One browser serves both discovery and the re-crawl
+    async with crawl_session() as crawler:
+        # Discover URLs
+        discovered = await discover_urls(
+            seed_urls=seed_urls,
+            include_patterns=compile_url_patterns(config.get('include_patterns')),
+            base_url=base_url,
+            language=lang,
+            max_concurrent=concurrent,
+            page_timeout=page_timeout,
+            excluded_tags=excluded_tags,
+            normalize_url=normalize_url,
+            exclude_patterns=compile_url_patterns(config.get('exclude_patterns')),
+            depth=discovery_depth,
+            crawler=crawler,
+        )
 
-    # Add known pages
-    if mappings_module:
-        known_urls = mappings_module.build_urls(base_url, lang)
-        for url in known_urls.values():
-            urls.add(url)
+        # Add known pages (ordered dedup: discovered first, then known)
+        urls = dict.fromkeys(discovered)
+        if mappings_module:
+            known_urls = mappings_module.build_urls(base_url, lang)
+            urls.update(dict.fromkeys(known_urls.values()))
 
-    # URL to file path function
-    def url_to_filepath(url: str) -> str:
-        if mappings_module and hasattr(mappings_module, 'get_file_path_from_url'):
-            return mappings_module.get_file_path_from_url(url)
-        from urllib.parse import urlparse
-        parsed = urlparse(url)
-        path = parsed.path.strip('/')
-        return path  # Keep slashes for hierarchical structure
-
-    print(f"Crawling {len(urls)} pages to check for changes...")
-
-    # Crawl all pages
-    crawl_results = await crawl_pages(
-        urls=list(urls),
-        max_concurrent=concurrent,
-        page_timeout=page_timeout,
-        excluded_tags=excluded_tags,
-    )
+        print(f"Crawling {len(urls)} pages to check for changes...")
+
+        # Crawl all pages
+        crawl_results = await crawl_pages(
+            urls=urls.keys(),
+            max_concurrent=concurrent,
+            page_timeout=page_timeout,
+            excluded_tags=excluded_tags,
+            crawler=crawler,
+            crawl_state=state,
+        )
 
-    results = []
     saved_pages = state.get_all_pages()
 
     # Load cleaner for consistent hash computation
-    cleaner = load_source_cleaner(source_name, config)
+    cleaner = load_source_cleaner(source_name)
 
     # Title cleaner
     output_config = config.get('output', {})
-    title_pattern = output_config.get('title_suffix_pattern')
+    clean_title = _make_clean_title(output_config.get('title_suffix_pattern'))
 
-    def clean_title(title: str) -> str:
-        if title_pattern:
-            title = re.sub(title_pattern, '', title)
-        return title.strip()
-
-    # Check each crawled page
-    for url, crawl_result in crawl_results.items():
-        file_path = url_to_filepath(url)
-        if not file_path:
-            continue
-
-        # Clean content same way as generator
-        markdown_content = crawl_result.get('markdown', '')
-        title = crawl_result.get('title', '') or file_path.split('/')[-1]
-        title = clean_title(title)
-        markdown_content = cleaner.clean(markdown_content, title)
-
-        # Compute hash the same way as generator
-        from crawl4ai_toolkit.state import compute_content_hash
-        new_hash = compute_content_hash(f"# {title}\n\n{markdown_content}")
-
-        saved_state = saved_pages.get(file_path)
-
-        if saved_state is None:
-            results.append(ChangeResult(url, file_path, 'new', 'new_page'))
-        elif new_hash != saved_state.get('content_hash'):
-            results.append(ChangeResult(url, file_path, 'changed', 'content_hash'))
-        else:
-            results.append(ChangeResult(url, file_path, 'unchanged', 'content_hash'))
+    # Same fingerprint as the crawl mixes into saved raw hashes
+    fingerprint = generation_fingerprint(
+        crawl_results.keys(),
+        settings=_settings_fingerprint(source_name, config),
+        frontmatter=output_config.get('frontmatter', True),
+        base_url=base_url if output_config.get('transform_links', True) else None,
+    )
+
+    # Map each crawled URL to its file path once
+    path_by_url = {url: url_to_filepath(url) for url in crawl_results}
+
+    # Check each crawled page: cleaning + hashing runs on a thread pool
+    # sized to the CPU count, off the event loop
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        results = list(await asyncio.gather(*(
+            loop.run_in_executor(
+                pool,
+                _process_page,
+                url,
+                path_by_url[url],
+                crawl_result,
+                saved_pages,
+                cleaner,
+                clean_title,
+                fingerprint,
+            )
+            for url, crawl_result in crawl_results.items()
+            if path_by_url[url]
+        )))
 
     # Check for removed pages (in state but not in crawl results)
-    crawled_paths = {url_to_filepath(url) for url in crawl_results.keys()}
-    for file_path, page_state in saved_pages.items():
-        if file_path not in crawled_paths:
-            results.append(ChangeResult(
-                page_state.get('url', ''),
-                file_path,
-                'removed',
-                'not_found'
-            ))
+    crawled_paths = set(path_by_url.values())
+    results.extend(
+        ChangeResult(page_state.get('url', ''), file_path, 'removed', 'not_found')
+        for file_path, page_state in saved_pages.items()
+        if file_path not in crawled_paths
+    )
 
     print_change_report(results, source_name, state.get_last_crawl(), is_remote=True)
 
@@ -300,8 +487,15 @@ async def run_crawl(
     skip_discovery: bool = False,
     max_concurrent: Optional[int] = None,
     language: Optional[str] = None,
+    force: bool = False,
 ):
-    """Run the crawl for a source."""
+    """
+    Run the crawl for a source.
+
+    With force, every page is crawled again (saved ETag/Last-Modified
+    are not sent), then cleaned and regenerated even if its raw crawl
+    output matches the saved state.
+    """
     # Load config
     config = load_source_config(source_name)
     print("=" * 60)
@@ -322,6 +516,13 @@ async def run_crawl(
     print(f"Max concurrent: {concurrent}")
     print("=" * 60)
 
+    # Load crawl state up front, so an unreadable state file stops the run
+    # before any crawling (its validators also let Phase 2 skip pages that
+    # are unchanged on the server, unless forced)
+    source_dir = PROJECT_ROOT / "sources" / source_name
+    output_dir = source_dir / "output"
+    crawl_state = CrawlState(source_dir, compress=config.get('state', {}).get('compress', False))
+
     # Load URL mappings
     mappings_module = load_url_mappings(source_name)
 
@@ -330,81 +531,67 @@ async def run_crawl(
         f"{base_url}{url}" for url in config.get('seed_urls', [])
     ]
 
-    # Define URL normalization function
-    def normalize_url(url: str, language: str) -> str:
-        if mappings_module and hasattr(mappings_module, 'normalize_mdn_url'):
-            return mappings_module.normalize_mdn_url(url, language)
-        return url
-
-    # Phase 1: Discover URLs
-    if skip_discovery and mappings_module:
-        # Use known pages
-        known_urls = mappings_module.build_urls(base_url, lang)
-        urls = set(known_urls.values())
-        print(f"\nUsing {len(urls)} known URLs (discovery skipped)")
-    else:
-        urls = await discover_urls(
-            seed_urls=seed_urls,
-            include_patterns=config.get('include_patterns', []),
-            base_url=base_url,
-            language=lang,
+    # URL normalization function
+    normalize_url = _make_normalize_url(mappings_module)
+
+    # One browser serves both discovery and crawling
+    async with crawl_session() as crawler:
+        # Phase 1: Discover URLs
+        if skip_discovery and mappings_module:
+            # Use known pages
+            known_urls = mappings_module.build_urls(base_url, lang)
+            urls = dict.fromkeys(known_urls.values())
+            print(f"\nUsing {len(urls)} known URLs (discovery skipped)")
+        else:
+            discovered = await discover_urls(
+                seed_urls=seed_urls,
+                include_patterns=compile_url_patterns(config.get('include_patterns')),
+                base_url=base_url,
+                language=lang,
+                max_concurrent=concurrent,
+                page_timeout=page_timeout,
+                excluded_tags=excluded_tags,
+                normalize_url=normalize_url,
+                exclude_patterns=compile_url_patterns(config.get('exclude_patterns')),
+                depth=discovery_depth,
+                crawler=crawler,
+            )
+
+            # Add known pages (ordered dedup: discovered first, then known)
+            urls = dict.fromkeys(discovered)
+            if mappings_module:
+                known_urls = mappings_module.build_urls(base_url, lang)
+                urls.update(dict.fromkeys(known_urls.values()))
+
+        if discover_only:
+            print(f"\n{'=' * 60}")
+            print(f"Discovered {len(urls)} URLs:")
+            print("=" * 60)
+            for url in sorted(urls):
+                print(f"  {url}")
+            print(f"\nTotal: {len(urls)} URLs")
+            return
+
+        # Phase 2: Crawl pages
+        results = await crawl_pages(
+            urls=urls.keys(),
             max_concurrent=concurrent,
             page_timeout=page_timeout,
             excluded_tags=excluded_tags,
-            normalize_url=normalize_url,
-            exclude_patterns=config.get('exclude_patterns'),
-            depth=discovery_depth,
+            crawler=crawler,
+            crawl_state=None if force else crawl_state,
+            output_dir=output_dir,
         )
 
-        # Add known pages
-        if mappings_module:
-            known_urls = mappings_module.build_urls(base_url, lang)
-            for url in known_urls.values():
-                urls.add(url)
-
-    if discover_only:
-        print(f"\n{'=' * 60}")
-        print(f"Discovered {len(urls)} URLs:")
-        print("=" * 60)
-        for url in sorted(urls):
-            print(f"  {url}")
-        print(f"\nTotal: {len(urls)} URLs")
-        return
-
-    # Phase 2: Crawl pages
-    results = await crawl_pages(
-        urls=list(urls),
-        max_concurrent=concurrent,
-        page_timeout=page_timeout,
-        excluded_tags=excluded_tags,
-    )
-
     # Phase 3: Generate files
-    source_dir = PROJECT_ROOT / "sources" / source_name
-    output_dir = source_dir / "output"
-    cleaner = load_source_cleaner(source_name, config)
-
-    # Initialize crawl state for tracking
-    crawl_state = CrawlState(source_dir)
+    cleaner = load_source_cleaner(source_name)
 
     # URL to file path function
-    def url_to_filepath(url: str) -> str:
-        if mappings_module and hasattr(mappings_module, 'get_file_path_from_url'):
-            return mappings_module.get_file_path_from_url(url)
-        # Fallback: use URL path
-        from urllib.parse import urlparse
-        parsed = urlparse(url)
-        path = parsed.path.strip('/')
-        return path  # Keep slashes for hierarchical structure
+    url_to_filepath = _make_url_to_filepath(mappings_module)
 
     # Title cleaner
     output_config = config.get('output', {})
-    title_pattern = output_config.get('title_suffix_pattern')
-
-    def clean_title(title: str) -> str:
-        if title_pattern:
-            title = re.sub(title_pattern, '', title)
-        return title.strip()
+    clean_title = _make_clean_title(output_config.get('title_suffix_pattern'))
 
     files_written, index_entries = generate_markdown_files(
         results=results,
@@ -416,6 +603,8 @@ async def run_crawl(
         crawl_state=crawl_state,
         base_url=base_url,
         transform_internal_links=output_config.get('transform_links', True),
+        settings_fingerprint=_settings_fingerprint(source_name, config),
+        force=force,
     )
 
     # Save crawl state
@@ -479,6 +668,11 @@ def main():
         action="store_true",
         help="Skip URL discovery, use only known pages list"
     )
+    parser.add_argument(
+        "--force", "-f",
+        action="store_true",
+        help="Re-crawl and regenerate every page, ignoring saved change-detection state"
+    )
     parser.add_argument(
         "--check",
         action="store_true",
@@ -501,9 +695,9 @@ def main():
         print("Available sources:")
         print("-" * 40)
         for source in sources:
-            print(f"  {source['name']}")
-            print(f"    Title: {source['title']}")
-            print(f"    URL: {source['base_url']}")
+            print(f"  {source.name}")
+            print(f"    Title: {source.title}")
+            print(f"    URL: {source.base_url}")
             print()
         return
 
@@ -528,8 +722,9 @@ def main():
                 skip_discovery=args.skip_discovery,
                 max_concurrent=args.max_concurrent,
                 language=args.language,
+                force=args.force,
             ))
-    except FileNotFoundError as e:
+    except (FileNotFoundError, RuntimeError) as e:
         print(f"Error: {e}")
         sys.exit(1)
     except KeyboardInterrupt:
@@ -4,16 +4,28 @@ Crawl4AI Toolkit - Generic web crawling library
 A modular toolkit for crawling documentation sites and converting to markdown.
 """
 
-from .crawler import discover_urls, crawl_pages
-from .cleaner import CleanerBase, clean_heading_anchors, clean_excessive_whitespace
-from .generator import generate_markdown_files, generate_index
+from .crawler import discover_urls, crawl_pages, crawl_session, compile_url_patterns
+from .cleaner import (
+    CleanerBase,
+    clean_heading_anchors,
+    clean_excessive_whitespace,
+    compile_linear_re,
+)
+from .generator import generate_markdown_files, generate_index, generation_fingerprint
 from .state import (
     CrawlState,
     ChangeResult,
     compute_content_hash,
+    compute_page_hash,
+    compute_raw_hash,
+    hash_algorithm,
     check_headers,
+    not_modified_reason,
     check_page_changed,
+    check_pages_changed_bulk,
+    open_http_session,
     check_local_file,
+    check_local_files_parallel,
     print_change_report,
 )
 
@@ -23,19 +35,30 @@ __all__ = [
     # Crawler
     "discover_urls",
     "crawl_pages",
+    "crawl_session",
+    "compile_url_patterns",
     # Cleaner
     "CleanerBase",
     "clean_heading_anchors",
     "clean_excessive_whitespace",
+    "compile_linear_re",
     # Generator
     "generate_markdown_files",
+    "generation_fingerprint",
     "generate_index",
     # State / Change detection
     "CrawlState",
     "ChangeResult",
     "compute_content_hash",
+    "compute_page_hash",
+    "compute_raw_hash",
+    "hash_algorithm",
     "check_headers",
+    "not_modified_reason",
     "check_page_changed",
+    "check_pages_changed_bulk",
+    "open_http_session",
     "check_local_file",
+    "check_local_files_parallel",
     "print_change_report",
 ]
@@ -6,7 +6,89 @@ source-specific cleaners to extend.
 """
 
 import re
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Pattern, Tuple
+
+try:  # Optional: google-re2 matches in linear time (no backtracking)
+    import re2
+except ImportError:
+    re2 = None
+
+
+# Inline forms of the flags RE2 understands
+_RE2_INLINE_FLAGS = ((re.IGNORECASE, 'i'), (re.MULTILINE, 'm'), (re.DOTALL, 's'))
+
+
+def compile_linear_re(pattern: str, flags: int = 0) -> Pattern:
+    """
+    Compile a pattern with google-re2 when possible, else with re.
+
+    RE2 runs in time linear in the input, so patterns with nested optional
+    groups cannot backtrack catastrophically on odd pages. Patterns RE2
+    rejects (lookarounds, backreferences) and flags other than IGNORECASE,
+    MULTILINE and DOTALL fall back to re. Note that under RE2, \\s, \\w
+    and \\d are ASCII-only.
+
+    Args:
+        pattern: Regex pattern
+        flags: re flags
+
+    Returns:
+        Compiled pattern supporting search/match/sub/finditer
+    """
+    if re2 is not None:
+        inline = ''.join(letter for flag, letter in _RE2_INLINE_FLAGS if flags & flag)
+        if not flags & ~(re.IGNORECASE | re.MULTILINE | re.DOTALL):
+            try:
+                return re2.compile(f'(?{inline}){pattern}' if inline else pattern)
+            except re2.error:
+                pass
+    return re.compile(pattern, flags)
+
+
+# Precompiled patterns, applied to the whole document in one pass.
+# Line-oriented patterns avoid \s / negated classes that could cross '\n'.
+_HEADING_ANCHOR_RE = re.compile(
+    r'^(#{1,6})[^\S\n]+\[([^\]\n]+)\]\([^)\n]+\)[^\S\n]*$',
+    re.MULTILINE,
+)
+_BLANK_RUN_RE = re.compile(r'\n{3,}')
+
+
+@lru_cache(maxsize=64)
+def _compile_section_re(heading: str, heading_level: int) -> re.Pattern:
+    """Compile (and cache) the pattern matching a section under a heading."""
+    hashes = "#" * heading_level
+    return re.compile(
+        rf'^{hashes}\s+{re.escape(heading)}.*?(?=^{hashes}\s|\Z)',
+        re.MULTILINE | re.DOTALL,
+    )
+
+
+# Line-removal patterns run against '\n' + content so that every line,
+# including the first, is matched together with its leading separator.
+@lru_cache(maxsize=64)
+def _compile_line_re(text: str) -> re.Pattern:
+    """Compile (and cache) the pattern matching a line containing text."""
+    return compile_linear_re(rf'\n[^\n]*?{re.escape(text)}[^\n]*')
+
+
+@lru_cache(maxsize=64)
+def _compile_section_start_re(headings: Tuple[str, ...]) -> re.Pattern:
+    """Compile (and cache) the pattern matching a line opening one of the H2 sections."""
+    return re.compile(rf'##\s+(?:{"|".join(map(re.escape, headings))})')
+
+
+@lru_cache(maxsize=64)
+def _compile_block_re(start_marker: str) -> re.Pattern:
+    """
+    Compile (and cache) the pattern matching a marker line plus the
+    indented or blank lines that follow it.
+    """
+    return re.compile(
+        rf'\n[^\n]*?{re.escape(start_marker)}[^\n]*'
+        r'(?:\n(?: [^\n]*|[^\S\n]*)(?=\n|\Z))*'
+    )
 
 
 def clean_heading_anchors(content: str) -> str:
@@ -15,20 +97,9 @@ def clean_heading_anchors(content: str) -> str:
 
     Transforms: ## [Title](url) -> ## Title
     """
-    lines = content.split('\n')
-    cleaned_lines = []
-
-    for line in lines:
-        # Match headings with anchor links: ## [Title](url)
-        heading_match = re.match(r'^(#{1,6})\s+\[([^\]]+)\]\([^)]+\)\s*$', line)
-        if heading_match:
-            level = heading_match.group(1)
-            heading_text = heading_match.group(2)
-            cleaned_lines.append(f"{level} {heading_text}")
-        else:
-            cleaned_lines.append(line)
-
-    return '\n'.join(cleaned_lines)
+    if '](' not in content:
+        return content
+    return _HEADING_ANCHOR_RE.sub(r'\1 \2', content)
 
 
 def clean_excessive_whitespace(content: str) -> str:
@@ -36,7 +107,8 @@ def clean_excessive_whitespace(content: str) -> str:
     Reduce multiple consecutive blank lines to maximum of two.
     Also strips leading/trailing whitespace.
     """
-    content = re.sub(r'\n{3,}', '\n\n', content)
+    if '\n\n\n' in content:
+        content = _BLANK_RUN_RE.sub('\n\n', content)
     return content.strip()
 
 
@@ -45,16 +117,28 @@ class CleanerBase:
     Base class for markdown content cleaners.
 
     Provides common cleaning methods that can be extended
-    for source-specific cleaning needs.
+    for source-specific cleaning needs. Cleaners hold no per-page state
+    (patterns are compiled at module level and the helpers are static),
+    so one instance is shared by every page and worker thread.
 
     Usage:
         class MyCleaner(CleanerBase):
+            # Line and section removals folded into the base cleaning pass
+            drop_first_h1 = True
+            drop_lines_containing = ("cookie policy",)
+            drop_sections = ("See also", "Specifications")
+
             def clean(self, content: str, title: str = "") -> str:
                 content = super().clean(content, title)
                 # Add custom cleaning here
                 return content
     """
 
+    # Applied by the base clean() in the same pass as anchor/blank-line cleanup
+    drop_first_h1: bool = False
+    drop_lines_containing: Tuple[str, ...] = ()
+    drop_sections: Tuple[str, ...] = ()  # H2 headings, see remove_section
+
     def clean(self, content: str, title: str = "") -> str:
         """
         Apply base cleaning operations.
@@ -69,11 +153,92 @@ class CleanerBase:
         Returns:
             Cleaned markdown content
         """
-        content = clean_heading_anchors(content)
-        content = clean_excessive_whitespace(content)
-        return content
+        return self._fused_base_clean(
+            content,
+            drop_first_h1=self.drop_first_h1,
+            drop_lines_containing=self.drop_lines_containing,
+            drop_sections=self.drop_sections,
+        )
+
+    @staticmethod
+    def _fused_base_clean(
+        content: str,
+        *,
+        drop_first_h1: bool = False,
+        drop_lines_containing: Tuple[str, ...] = (),
+        drop_sections: Tuple[str, ...] = (),
+    ) -> str:
+        """
+        Apply base cleaning and common removals in a single pass.
+
+        Same result as clean_heading_anchors followed by
+        clean_excessive_whitespace, optionally also removing each
+        drop_sections H2 section (as remove_section does), the first H1
+        and every line containing one of drop_lines_containing, in that
+        order (removals happen before blank lines are collapsed).
 
-    def remove_section(self, content: str, heading: str, heading_level: int = 2) -> str:
+        Args:
+            content: Raw markdown content
+            drop_first_h1: Whether to drop the first "# " heading line
+            drop_lines_containing: Texts whose lines should be dropped
+            drop_sections: H2 heading texts whose sections should be dropped
+
+        Returns:
+            Cleaned markdown content
+        """
+        out = []
+        blank_run = 0
+        # Heading anchors need "](": skip the per-line match on pages without links
+        has_links = '](' in content
+        section_start_re = _compile_section_start_re(drop_sections) if drop_sections else None
+        in_section = False
+
+        lines = content.split('\n')
+        last = len(lines) - 1
+        for i, line in enumerate(lines):
+            if has_links and line.startswith('#'):
+                heading_match = _HEADING_ANCHOR_RE.match(line)
+                if heading_match:
+                    line = f"{heading_match.group(1)} {heading_match.group(2)}"
+
+            if in_section:
+                # A section runs until the next H2 heading ("##" + whitespace)
+                if not line.startswith('##') or not (
+                    line[2:3].isspace() or (line == '##' and i < last)
+                ):
+                    continue
+                in_section = False
+            if section_start_re is not None and line.startswith('##'):
+                heading = line
+                if not line[2:].strip():
+                    # Bare "##": like remove_section, look past blank lines
+                    j = i + 1
+                    while j < last and not lines[j].strip():
+                        j += 1
+                    heading = '\n'.join(lines[i:j + 1])
+                if section_start_re.match(heading):
+                    in_section = True
+                    continue
+
+            if drop_first_h1 and line.startswith('# '):
+                drop_first_h1 = False
+                continue
+            if drop_lines_containing and any(text in line for text in drop_lines_containing):
+                continue
+
+            # Keep at most one empty line between blocks
+            if line:
+                blank_run = 0
+            else:
+                blank_run += 1
+                if blank_run > 1:
+                    continue
+            out.append(line)
+
+        return '\n'.join(out).strip()
+
+    @staticmethod
+    def remove_section(content: str, heading: str, heading_level: int = 2) -> str:
         """
         Remove a section starting with the given heading.
 
@@ -85,29 +250,37 @@ class CleanerBase:
         Returns:
             Content with the section removed
         """
-        pattern = rf'^{"#" * heading_level}\s+{re.escape(heading)}.*?(?=^{"#" * heading_level}\s|\Z)'
-        return re.sub(pattern, '', content, flags=re.MULTILINE | re.DOTALL)
+        # Plain substring scan first: most pages lack most sections
+        if heading not in content:
+            return content
+        return _compile_section_re(heading, heading_level).sub('', content)
 
-    def remove_first_h1(self, content: str) -> str:
+    @staticmethod
+    def remove_first_h1(content: str) -> str:
         """
         Remove the first H1 heading (often duplicated with frontmatter title).
         """
-        lines = content.split('\n')
-        for i, line in enumerate(lines):
-            if line.startswith('# '):
-                lines.pop(i)
-                break
-        return '\n'.join(lines)
+        if content.startswith('# '):
+            end = content.find('\n')
+            return content[end + 1:] if end != -1 else ''
+
+        start = content.find('\n# ')
+        if start == -1:
+            return content
+        end = content.find('\n', start + 1)
+        return content[:start] + (content[end:] if end != -1 else '')
 
-    def remove_lines_containing(self, content: str, text: str) -> str:
+    @staticmethod
+    def remove_lines_containing(content: str, text: str) -> str:
         """
         Remove all lines containing the specified text.
         """
-        lines = content.split('\n')
-        return '\n'.join(line for line in lines if text not in line)
+        if text not in content and not text.startswith('\n'):
+            return content
+        return _compile_line_re(text).sub('', '\n' + content)[1:]
 
+    @staticmethod
     def remove_block_until_heading(
-        self,
         content: str,
         start_marker: str,
         end_pattern: Optional[str] = None
@@ -123,6 +296,14 @@ class CleanerBase:
         Returns:
             Content with the block removed
         """
+        if start_marker not in content and not start_marker.startswith('\n'):
+            return content
+
+        if end_pattern is None:
+            # Block runs over indented/blank lines; strip them in one pass
+            return _compile_block_re(start_marker).sub('', '\n' + content)[1:]
+
+        end_re = re.compile(end_pattern) if end_pattern else None
         lines = content.split('\n')
         cleaned_lines = []
         in_block = False
@@ -134,7 +315,7 @@ class CleanerBase:
 
             if in_block:
                 # Check for end of block
-                if end_pattern and re.search(end_pattern, line):
+                if end_re is not None and end_re.search(line):
                     in_block = False
                 elif line.startswith('#') or (line.strip() and not line.startswith(' ')):
                     in_block = False
@@ -5,39 +5,162 @@ Provides URL discovery and page crawling functionality that can be
 configured for different documentation sources.
 """
 
+import asyncio
 import re
-from typing import List, Dict, Set, Optional, Callable
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import (
+    AsyncIterator,
+    Collection,
+    Iterable,
+    List,
+    Dict,
+    Set,
+    Optional,
+    Callable,
+    Pattern,
+    Union,
+)
 from urllib.parse import urljoin
 
-from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig, CacheMode
+try:  # Optional: google-re2 matches URL filters in linear time (no backtracking)
+    import re2
+except ImportError:
+    re2 = None
+
+from crawl4ai import (
+    AsyncWebCrawler,
+    BrowserConfig,
+    CrawlerRunConfig,
+    CacheMode,
+    SemaphoreDispatcher,
+)
+
+from .state import CrawlState, not_modified_reason, open_http_session
+
+
+# Browser settings shared by discovery and page crawling
+DEFAULT_BROWSER_CONFIG = BrowserConfig(
+    headless=True,
+    viewport_width=1280,
+    viewport_height=800,
+    verbose=False
+)
+
+
+def compile_url_patterns(patterns: Optional[Iterable[str]]) -> Optional[Pattern]:
+    """
+    Combine URL regex patterns into a single compiled alternation.
+
+    Searching the result matches a URL iff any one pattern would, but in a
+    single regex scan instead of one re.search per pattern. Uses google-re2
+    when installed, falling back to re for patterns RE2 cannot handle
+    (lookarounds, backreferences).
+
+    Args:
+        patterns: Regex patterns (may be None or empty)
+
+    Returns:
+        Compiled pattern, or None if there are no patterns
+    """
+    patterns = list(patterns or ())
+    if not patterns:
+        return None
+    union = '|'.join(f'(?:{pattern})' for pattern in patterns)
+    if re2 is not None:
+        try:
+            return re2.compile(union)
+        except re2.error:
+            pass
+    return re.compile(union)
+
+
+@lru_cache(maxsize=32)
+def _compile_url_patterns_cached(patterns: tuple) -> Optional[Pattern]:
+    """compile_url_patterns, cached per (hashable) pattern tuple."""
+    return compile_url_patterns(patterns)
+
+
+def _as_url_pattern(patterns: Union[Iterable[str], Pattern, None]) -> Optional[Pattern]:
+    """Accept either raw pattern strings or an already compiled pattern."""
+    if hasattr(patterns, 'search'):
+        return patterns
+    return _compile_url_patterns_cached(tuple(patterns or ()))
+
+
+def _make_dispatcher(max_concurrent: int) -> SemaphoreDispatcher:
+    """
+    Dispatcher for arun_many that caps in-flight pages at max_concurrent.
+
+    arun_many has no max_concurrent argument; without a dispatcher the
+    configured limit would be silently ignored.
+    """
+    return SemaphoreDispatcher(semaphore_count=max_concurrent)
+
+
+@asynccontextmanager
+async def crawl_session(
+    browser_config: Optional[BrowserConfig] = None,
+) -> AsyncIterator[AsyncWebCrawler]:
+    """
+    Start one crawler (browser) to share across discovery and crawling.
+
+    Pass the yielded crawler to discover_urls and crawl_pages so both
+    phases reuse the same browser and connections; it is closed on exit.
+
+    Usage:
+        async with crawl_session() as crawler:
+            urls = await discover_urls(..., crawler=crawler)
+            results = await crawl_pages(urls, crawler=crawler)
+
+    Args:
+        browser_config: Browser settings (defaults to DEFAULT_BROWSER_CONFIG)
+    """
+    async with AsyncWebCrawler(config=browser_config or DEFAULT_BROWSER_CONFIG) as crawler:
+        yield crawler
+
+
+@asynccontextmanager
+async def _use_crawler(crawler: Optional[AsyncWebCrawler]) -> AsyncIterator[AsyncWebCrawler]:
+    """Yield the given crawler, or a new crawl_session() if None."""
+    if crawler is not None:
+        yield crawler
+        return
+    async with crawl_session() as new_crawler:
+        yield new_crawler
 
 
 async def discover_urls(
     seed_urls: List[str],
-    include_patterns: List[str],
+    include_patterns: Union[List[str], Pattern],
     base_url: str,
     language: str = "en-US",
     max_concurrent: int = 5,
     page_timeout: int = 30000,
     excluded_tags: Optional[List[str]] = None,
     normalize_url: Optional[Callable[[str, str], str]] = None,
-    exclude_patterns: Optional[List[str]] = None,
+    exclude_patterns: Union[List[str], Pattern, None] = None,
     depth: int = 1,
+    crawler: Optional[AsyncWebCrawler] = None,
 ) -> Set[str]:
     """
     Discover URLs by crawling seed pages and extracting internal links.
 
     Args:
         seed_urls: Initial URLs to crawl for link discovery
-        include_patterns: Regex patterns to filter discovered URLs
+        include_patterns: Regex patterns to filter discovered URLs (or a pattern
+            from compile_url_patterns)
         base_url: Base URL for the site (e.g., "https://developer.mozilla.org")
         language: Language code for URL normalization
         max_concurrent: Maximum concurrent crawls
         page_timeout: Page load timeout in milliseconds
         excluded_tags: HTML tags to exclude from content
         normalize_url: Optional function to normalize URLs (receives url, language)
-        exclude_patterns: Regex patterns to exclude URLs (applied after include)
+        exclude_patterns: Regex patterns to exclude URLs (applied after include;
+            may also be precompiled)
         depth: How many levels deep to crawl for discovery (1 = seeds only, 2+ = recursive)
+        crawler: Optional running crawler to reuse (a new one is started if None)
 
     Returns:
         Set of discovered URLs matching the include patterns
@@ -47,15 +170,13 @@ async def discover_urls(
 
     print(f"Phase 1: Discovering URLs (depth={depth})...")
 
-    discovered: Set[str] = set()
-    crawled: Set[str] = set()  # Track already crawled URLs to avoid duplicates
+    include_re = _as_url_pattern(include_patterns)
+    exclude_re = _as_url_pattern(exclude_patterns)
 
-    browser_config = BrowserConfig(
-        headless=True,
-        viewport_width=1280,
-        viewport_height=800,
-        verbose=False
-    )
+    # Every URL seen so far; a URL is queued for crawling only when first seen
+    discovered: Set[str] = set()
+    # URLs whose crawl failed once; each is retried at the next level only
+    retried: Set[str] = set()
 
     crawler_config = CrawlerRunConfig(
         cache_mode=CacheMode.BYPASS,
@@ -64,12 +185,22 @@ async def discover_urls(
         page_timeout=page_timeout,
     )
 
-    def extract_urls_from_result(result, label: str) -> Set[str]:
-        """Extract matching URLs from a crawl result."""
-        urls = set()
-        if result.success:
-            discovered.add(result.url)
-            crawled.add(result.url)
+    def extract_new_urls(results, label: str) -> List[str]:
+        """
+        Record a level's crawled URLs and return the next level's frontier:
+        their matching, not yet seen links, plus failed URLs not yet retried.
+        """
+        succeeded = [result for result in results if result.success]
+        # Pages crawled at this level must not be queued again by their siblings
+        discovered.update(result.url for result in succeeded)
+
+        urls = []
+        for result in results:
+            if not result.success and result.url not in retried:
+                retried.add(result.url)
+                urls.append(result.url)
+
+        for result in succeeded:
             print(f"  {label}: {result.url}")
 
             internal_links = result.links.get('internal', [])
@@ -79,78 +210,104 @@ async def discover_urls(
                 if href.startswith('/'):
                     href = f"{base_url}{href}"
 
-                if _url_matches_patterns(href, include_patterns):
-                    if exclude_patterns and _url_matches_patterns(href, exclude_patterns):
+                if include_re is not None and include_re.search(href):
+                    if exclude_re is not None and exclude_re.search(href):
                         continue
                     if normalize_url:
                         href = normalize_url(href, language)
-                    urls.add(href)
+                    if href not in discovered:
+                        discovered.add(href)
+                        urls.append(href)
         return urls
 
-    async with AsyncWebCrawler(config=browser_config) as crawler:
+    async with _use_crawler(crawler) as crawler:
         # Level 0: Crawl seed URLs
         print(f"  Crawling {len(seed_urls)} seed URLs...")
         results = await crawler.arun_many(
             urls=seed_urls,
             config=crawler_config,
-            max_concurrent=max_concurrent
+            dispatcher=_make_dispatcher(max_concurrent),
         )
 
-        for result in results:
-            new_urls = extract_urls_from_result(result, "Seed")
-            discovered.update(new_urls)
+        frontier = extract_new_urls(results, "Seed")
 
-        # Levels 1 to depth-1: Crawl discovered URLs recursively
+        # Levels 1 to depth-1: Crawl the URLs first found at the previous level
         for level in range(1, depth):
-            # Find URLs that haven't been crawled yet
-            urls_to_crawl = [url for url in discovered if url not in crawled]
-            if not urls_to_crawl:
+            if not frontier:
                 print(f"  Level {level + 1}: No new URLs to crawl")
                 break
+            urls_to_crawl = frontier
 
             print(f"  Level {level + 1}: Crawling {len(urls_to_crawl)} new URLs...")
             results = await crawler.arun_many(
                 urls=urls_to_crawl,
                 config=crawler_config,
-                max_concurrent=max_concurrent
+                dispatcher=_make_dispatcher(max_concurrent),
             )
 
-            new_count = 0
-            for result in results:
-                new_urls = extract_urls_from_result(result, f"L{level + 1}")
-                for url in new_urls:
-                    if url not in discovered:
-                        new_count += 1
-                        discovered.add(url)
+            frontier = extract_new_urls(results, f"L{level + 1}")
 
-            print(f"  Level {level + 1}: Found {new_count} new URLs")
+            print(f"  Level {level + 1}: Found {len(frontier)} new URLs")
 
     print(f"  Total discovered: {len(discovered)} URLs")
     return discovered
 
 
 def _url_matches_patterns(url: str, patterns: List[str]) -> bool:
-    """Check if URL matches any of the include patterns."""
-    for pattern in patterns:
-        if re.search(pattern, url):
-            return True
-    return False
+    """Check if URL matches any of the patterns (one search on their union)."""
+    pattern_re = _as_url_pattern(patterns)
+    return pattern_re is not None and pattern_re.search(url) is not None
 
 
-async def crawl_pages(
+async def _find_unchanged(
     urls: List[str],
+    saved_by_url: Dict[str, dict],
+    max_concurrent: int,
+    timeout: int = 10,
+) -> Dict[str, tuple]:
+    """
+    Check which URLs are unchanged since the last crawl, over one session.
+
+    Returns:
+        Dict mapping unchanged URL to (reason, saved page state)
+    """
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    # One keep-alive session (no cookie jar, cached DNS) for every check
+    async with open_http_session() as session:
+        async def check(url: str) -> tuple:
+            async with semaphore:
+                return url, await not_modified_reason(url, saved_by_url[url], session, timeout)
+
+        checks = await asyncio.gather(*(check(url) for url in urls if url in saved_by_url))
+
+    return {url: (reason, saved_by_url[url]) for url, reason in checks if reason}
+
+
+async def crawl_pages(
+    urls: Collection[str],
     max_concurrent: int = 5,
     page_timeout: int = 30000,
     excluded_tags: Optional[List[str]] = None,
+    crawler: Optional[AsyncWebCrawler] = None,
+    crawl_state: Optional[CrawlState] = None,
+    output_dir: Optional[Path] = None,
 ) -> Dict[str, dict]:
     """
     Crawl pages and extract content.
 
+    With crawl_state, pages whose stored ETag/Last-Modified still match
+    (conditional HEAD) are not re-crawled; they are returned without
+    markdown and with 'unchanged' set to the matching validator.
+
     Args:
-        urls: List of URLs to crawl
+        urls: URLs to crawl, in iteration order (list, set or dict keys)
         max_concurrent: Maximum concurrent crawls
         page_timeout: Page load timeout in milliseconds
         excluded_tags: HTML tags to exclude from content
+        crawler: Optional running crawler to reuse (a new one is started if None)
+        crawl_state: Optional state of the previous crawl, for conditional requests
+        output_dir: With crawl_state, only skip pages whose output file still exists
 
     Returns:
         Dict mapping URL to crawl result with keys:
@@ -159,19 +316,13 @@ async def crawl_pages(
         - description: Page description from metadata
         - markdown: Extracted markdown content
         - links: Internal and external links
+        - unchanged: Set instead of markdown for pages skipped as unchanged
     """
     if excluded_tags is None:
         excluded_tags = ["nav", "footer", "aside", "header", "script", "style"]
 
     print(f"\nPhase 2: Crawling {len(urls)} pages...")
 
-    browser_config = BrowserConfig(
-        headless=True,
-        viewport_width=1280,
-        viewport_height=800,
-        verbose=False
-    )
-
     crawler_config = CrawlerRunConfig(
         cache_mode=CacheMode.BYPASS,
         excluded_tags=excluded_tags,
@@ -182,45 +333,78 @@ async def crawl_pages(
 
     results_map = {}
     failed = []
-
-    async with AsyncWebCrawler(config=browser_config) as crawler:
-        # Process in batches to show progress
-        batch_size = max_concurrent * 2
-        url_list = list(urls)
-
-        for i in range(0, len(url_list), batch_size):
-            batch = url_list[i:i + batch_size]
-            batch_num = i // batch_size + 1
-            total_batches = (len(url_list) + batch_size - 1) // batch_size
-            print(f"  Batch {batch_num}/{total_batches}: {len(batch)} URLs")
-
-            batch_results = await crawler.arun_many(
-                urls=batch,
-                config=crawler_config,
-                max_concurrent=max_concurrent
-            )
-
-            for result in batch_results:
-                if result.success:
-                    results_map[result.url] = {
-                        'url': result.url,
-                        'title': result.metadata.get('title', ''),
-                        'description': result.metadata.get('description', ''),
-                        'markdown': result.markdown,
-                        'links': result.links,
-                        # HTTP headers for change detection
-                        'etag': result.response_headers.get('etag') if hasattr(result, 'response_headers') and result.response_headers else None,
-                        'last_modified': result.response_headers.get('last-modified') if hasattr(result, 'response_headers') and result.response_headers else None,
-                    }
-                    print(f"    OK: {result.url.split('/')[-1]}")
-                else:
+    url_list = list(urls)
+
+    # Fast path: a conditional HEAD answered 304 (or with the stored
+    # validator) means the page needs no browser crawl
+    unchanged = {}
+    if crawl_state is not None:
+        saved_by_url = {
+            page['url']: page
+            for file_path, page in crawl_state.get_all_pages().items()
+            if (page.get('etag') or page.get('last_modified'))
+            and (output_dir is None or (output_dir / f"{file_path}.md").exists())
+        }
+        unchanged = await _find_unchanged(url_list, saved_by_url, max_concurrent)
+        for url, (reason, page) in unchanged.items():
+            results_map[url] = {
+                'url': url,
+                'title': page.get('title', ''),
+                'unchanged': reason,
+                'etag': page.get('etag'),
+                'last_modified': page.get('last_modified'),
+            }
+        url_list = [url for url in url_list if url not in unchanged]
+        print(f"  {len(unchanged)} unchanged (conditional request), {len(url_list)} to crawl")
+
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async with _use_crawler(crawler) as crawler:
+        async def crawl_one(url: str) -> tuple:
+            """Crawl one URL; returns (url, result or None, error message)."""
+            async with semaphore:
+                try:
+                    result = await crawler.arun(url=url, config=crawler_config)
+                except Exception as e:
+                    # One page failing (timeout, browser crash) must not abort the others
+                    return url, None, str(e) or type(e).__name__
+            if result.success:
+                return url, result, None
+            return url, result, result.error_message or 'crawl failed'
+
+        # Each worker slot takes the next URL as soon as its page finishes
+        # (no batch barrier); results are handled in completion order
+        tasks = [asyncio.create_task(crawl_one(url)) for url in url_list]
+        total = len(tasks)
+
+        try:
+            for done, next_result in enumerate(asyncio.as_completed(tasks), 1):
+                url, result, error = await next_result
+                if error is not None:
                     failed.append({
-                        'url': result.url,
-                        'error': result.error_message
+                        'url': url,
+                        'error': error
                     })
-                    print(f"    FAIL: {result.url} - {result.error_message}")
-
-    print(f"  Crawled: {len(results_map)} success, {len(failed)} failed")
+                    print(f"    [{done}/{total}] FAIL: {url} - {error}")
+                    continue
+
+                results_map[result.url] = {
+                    'url': result.url,
+                    'title': result.metadata.get('title', ''),
+                    'description': result.metadata.get('description', ''),
+                    'markdown': result.markdown,
+                    'links': result.links,
+                    # HTTP headers for change detection
+                    'etag': result.response_headers.get('etag') if hasattr(result, 'response_headers') and result.response_headers else None,
+                    'last_modified': result.response_headers.get('last-modified') if hasattr(result, 'response_headers') and result.response_headers else None,
+                }
+                print(f"    [{done}/{total}] OK: {result.url.split('/')[-1]}")
+        finally:
+            # Leaving early (e.g. cancelled): stop the crawls still in flight
+            for task in tasks:
+                task.cancel()
+
+    print(f"  Crawled: {len(results_map) - len(unchanged)} success, {len(failed)} failed")
 
     if failed:
         print("\n  Failed URLs:")
@@ -5,14 +5,35 @@ Handles generating organized markdown files from crawl results,
 including frontmatter and index generation.
 """
 
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Callable, Optional, Any
+from typing import Collection, Dict, Iterable, List, Callable, Optional, Tuple, Any
+
+import yaml
+
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper
 
 from .cleaner import CleanerBase
-from .state import CrawlState, compute_content_hash
-from .link_transformer import transform_links
+from .state import (
+    CrawlState,
+    HASH_ALGORITHM,
+    compute_content_hash,
+    compute_page_hash,
+    compute_raw_hash,
+    hash_algorithm,
+)
+from .link_transformer import transform_links, build_crawled_index
+
+# content_hash line of an existing page's frontmatter (quoted or plain)
+CONTENT_HASH_RE = re.compile(rb'^content_hash: ["\']?([^"\'\r\n]+)', re.MULTILINE)
 
 
 def generate_markdown_files(
@@ -25,6 +46,8 @@ def generate_markdown_files(
     crawl_state: Optional[CrawlState] = None,
     base_url: Optional[str] = None,
     transform_internal_links: bool = True,
+    settings_fingerprint: str = "",
+    force: bool = False,
 ) -> tuple[int, dict]:
     """
     Generate organized markdown files from crawl results.
@@ -39,10 +62,15 @@ def generate_markdown_files(
         crawl_state: Optional CrawlState instance for tracking changes
         base_url: Base URL for link transformation (required if transform_internal_links=True)
         transform_internal_links: Whether to transform internal links to relative paths
+        settings_fingerprint: Text identifying the cleaning/output settings
+            (e.g. the source's config and cleaner code); pages are only kept
+            by their raw hash if it is unchanged
+        force: Clean and regenerate every page, ignoring saved raw hashes
 
     Returns:
         Tuple of (files_written, index_entries)
         where index_entries is a dict for building the index
+        (results marked 'unchanged' are indexed but not rewritten)
     """
     print(f"\nPhase 3: Generating markdown files in {output_dir}...")
 
@@ -51,87 +79,303 @@ def generate_markdown_files(
     if cleaner is None:
         cleaner = CleanerBase()
 
+    # Popular pages are link targets from many others: map each URL once
+    url_to_filepath = lru_cache(maxsize=None)(url_to_filepath)
+
     files_written = 0
     index_entries: Dict[str, List[tuple]] = {}
 
-    for url, result in results.items():
-        # Get file path from URL
-        file_path = url_to_filepath(url)
-        if not file_path:
-            print(f"  SKIP (no mapping): {url}")
-            continue
+    # One timestamp per run: identical reruns give identical frontmatter
+    crawled_at = datetime.now().isoformat()
+
+    # Link targets are the same for every page: index them once
+    crawled_index = build_crawled_index(results.keys())
+
+    # Map URLs to output files up front so each directory is created once
+    file_paths = {url: url_to_filepath(url) for url in results}
+
+    # Hash the raw crawl output together with everything else that shapes
+    # the output; pages whose raw hash matches the saved state and whose
+    # file still exists are not cleaned or rewritten
+    fingerprint = generation_fingerprint(
+        results.keys(),
+        settings=settings_fingerprint,
+        frontmatter=frontmatter,
+        base_url=base_url if transform_internal_links else None,
+    )
+    raw_hashes = {
+        url: compute_raw_hash(result.get('markdown', ''), result.get('title', ''), fingerprint=fingerprint)
+        for url, result in results.items()
+        if file_paths[url] and not result.get('unchanged')
+    }
+    kept_pages: Dict[str, dict] = {}
+    if crawl_state and not force:
+        for url, raw_hash in raw_hashes.items():
+            saved = crawl_state.get_page(file_paths[url])
+            if not saved or not saved.get('raw_hash'):
+                continue
+            algorithm = hash_algorithm(saved['raw_hash'])
+            if algorithm != HASH_ALGORITHM:
+                # Saved with another algorithm: compare like with like
+                result = results[url]
+                raw_hash = compute_raw_hash(
+                    result.get('markdown', ''), result.get('title', ''), algorithm, fingerprint
+                )
+            if saved['raw_hash'] == raw_hash and (output_dir / f"{file_paths[url]}.md").exists():
+                kept_pages[url] = saved
+
+    out_dirs = {
+        (output_dir / f"{file_path}.md").parent
+        for url, file_path in file_paths.items()
+        if file_path and not results[url].get('unchanged') and url not in kept_pages
+    }
+    for out_dir in out_dirs:
+        out_dir.mkdir(parents=True, exist_ok=True)
+
+    ctx = _GenerationContext(
+        output_dir=output_dir,
+        url_to_filepath=url_to_filepath,
+        cleaner=cleaner,
+        frontmatter=frontmatter,
+        title_cleaner=title_cleaner,
+        base_url=base_url if transform_internal_links else None,
+        crawled_urls=results.keys(),
+        crawled_index=crawled_index,
+        crawled_at=crawled_at,
+        cleaned={},
+    )
+
+    # Clean, transform and write pages concurrently; state and index
+    # updates stay on this thread, in input order
+    max_workers = min(32, (os.cpu_count() or 1) * 2)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            url: executor.submit(_process_one, url, file_paths[url], result, ctx, raw_hashes.get(url))
+            for url, result in results.items()
+            if file_paths[url] and url not in kept_pages
+        }
+
+        for url, result in results.items():
+            file_path = file_paths[url]
+            if not file_path:
+                print(f"  SKIP (no mapping): {url}")
+                continue
+
+            saved = kept_pages.get(url)
+            if saved is not None:
+                # Same raw content as last run: keep the file, refresh headers
+                title = saved.get('title', '') or file_path.split('/')[-1]
+                print(f"  Unchanged (raw hash): {file_path}.md")
+                crawl_state.set_page(
+                    file_path=file_path,
+                    url=url,
+                    content_hash=saved['content_hash'],
+                    title=title,
+                    etag=result.get('etag'),
+                    last_modified=result.get('last_modified'),
+                    raw_hash=raw_hashes[url],
+                )
+                category = _get_category(file_path)
+                index_entries.setdefault(category, []).append((title, f"{file_path}.md", url))
+                continue
+
+            title, content_hash, written = futures[url].result()
+            if content_hash is None:
+                print(f"  Unchanged: {file_path}.md")
+            else:
+                if written:
+                    files_written += 1
+                    print(f"  Written: {file_path}.md")
+                else:
+                    print(f"  Up to date: {file_path}.md")
+
+                # Update crawl state if provided
+                if crawl_state:
+                    crawl_state.set_page(
+                        file_path=file_path,
+                        url=url,
+                        content_hash=content_hash,
+                        title=title,
+                        etag=result.get('etag'),
+                        last_modified=result.get('last_modified'),
+                        raw_hash=raw_hashes[url],
+                    )
+
+            # Track for index
+            category = _get_category(file_path)
+            index_entries.setdefault(category, []).append((title, f"{file_path}.md", url))
+
+    print(f"  Total files written: {files_written}")
+    return files_written, index_entries
+
+
+def generation_fingerprint(
+    crawled_urls: Iterable[str],
+    settings: str = "",
+    frontmatter: bool = True,
+    base_url: Optional[str] = None,
+) -> str:
+    """
+    Fingerprint what shapes a generated page besides its raw content.
+
+    Mixed into each page's raw hash, so that a run with other cleaning or
+    output settings regenerates pages instead of keeping them.
+
+    Args:
+        crawled_urls: URLs crawled in this run; with link transformation,
+            they decide which links become relative paths
+        settings: Text identifying the source's cleaning/output settings
+        frontmatter: Whether pages have YAML frontmatter
+        base_url: Base URL links are transformed against (None if links
+            are not transformed)
+
+    Returns:
+        Fingerprint string (a content hash)
+    """
+    parts = [settings, f"frontmatter={frontmatter}", f"base_url={base_url or ''}"]
+    if base_url:
+        parts.extend(sorted(crawled_urls))
+    return compute_content_hash("\n".join(parts))
+
+
+@dataclass(frozen=True)
+class _GenerationContext:
+    """Settings shared by every page of a generate_markdown_files run."""
+    output_dir: Path
+    url_to_filepath: Callable[[str], str]
+    cleaner: CleanerBase
+    frontmatter: bool
+    title_cleaner: Optional[Callable[[str], str]]
+    base_url: Optional[str]
+    crawled_urls: Collection[str]
+    crawled_index: Dict[str, str]
+    crawled_at: str
+    cleaned: Dict[str, str]  # raw hash -> cleaned markdown, shared by alias URLs
+
+
+def _process_one(
+    url: str,
+    file_path: str,
+    result: dict,
+    ctx: _GenerationContext,
+    raw_hash: Optional[str] = None,
+) -> Tuple[str, Optional[str], bool]:
+    """
+    Clean, link-transform, hash and write a single page.
+
+    Safe to run in a worker thread: touches only its own output file,
+    whose parent directory must already exist.
 
-        # Extract content
-        markdown_content = result.get('markdown', '')
+    Args:
+        url: Page URL
+        file_path: Relative output path from url_to_filepath (without .md)
+        result: Crawl result data for the page
+        ctx: Shared generation settings
+        raw_hash: compute_raw_hash of the result, keying cleaned content so
+            pages crawled under several URLs are cleaned once
+
+    Returns:
+        (title, content_hash, written), with content_hash None for results
+        marked 'unchanged', and written False when the file was not
+        rewritten because it already had this content
+    """
+    # Unchanged since the last crawl: keep the existing file and state
+    if result.get('unchanged'):
         title = result.get('title', '') or file_path.split('/')[-1]
+        return title, None, False
+
+    # Extract content
+    markdown_content = result.get('markdown', '')
+    title = result.get('title', '') or file_path.split('/')[-1]
+
+    # Clean title if function provided
+    if ctx.title_cleaner:
+        title = ctx.title_cleaner(title)
+
+    # Clean content (the raw hash covers the markdown and title)
+    cleaned = ctx.cleaned.get(raw_hash) if raw_hash else None
+    if cleaned is None:
+        cleaned = ctx.cleaner.clean(markdown_content, title)
+        if raw_hash:
+            ctx.cleaned[raw_hash] = cleaned
+    markdown_content = cleaned
+
+    # Transform internal links to relative paths
+    if ctx.base_url:
+        markdown_content = transform_links(
+            content=markdown_content,
+            current_file_path=file_path,
+            base_url=ctx.base_url,
+            crawled_urls=ctx.crawled_urls,
+            url_to_filepath=ctx.url_to_filepath,
+            crawled_index=ctx.crawled_index,
+        )
+
+    # Compute content hash for change detection
+    content_hash = compute_page_hash(title, markdown_content)
+
+    # Build file content
+    if ctx.frontmatter:
+        meta = {
+            "title": title,
+            "url": url,
+            "crawled_at": ctx.crawled_at,
+            "content_hash": content_hash,
+        }
+        content = f"{_frontmatter(meta)}\n# {title}\n\n{markdown_content}\n"
+    else:
+        content = f"# {title}\n\n{markdown_content}"
 
-        # Clean title if function provided
-        if title_cleaner:
-            title = title_cleaner(title)
-
-        # Clean content
-        markdown_content = cleaner.clean(markdown_content, title)
-
-        # Transform internal links to relative paths
-        if transform_internal_links and base_url:
-            crawled_urls = set(results.keys())
-            markdown_content = transform_links(
-                content=markdown_content,
-                current_file_path=file_path,
-                base_url=base_url,
-                crawled_urls=crawled_urls,
-                url_to_filepath=url_to_filepath,
-            )
-
-        # Compute content hash for change detection
-        content_hash = compute_content_hash(f"# {title}\n\n{markdown_content}")
-
-        # Build file content
-        if frontmatter:
-            content = f"""---
-title: "{title}"
-url: "{url}"
-crawled_at: "{datetime.now().isoformat()}"
-content_hash: "{content_hash}"
----
+    # Determine output path
+    out_path = ctx.output_dir / f"{file_path}.md"
 
-# {title}
+    data = content.encode('utf-8')
 
-{markdown_content}
-"""
-        else:
-            content = f"# {title}\n\n{markdown_content}"
-
-        # Determine output path
-        out_path = output_dir / f"{file_path}.md"
-
-        # Create parent directories
-        out_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Write file
-        out_path.write_text(content, encoding='utf-8')
-        files_written += 1
-        print(f"  Written: {out_path.relative_to(output_dir)}")
-
-        # Update crawl state if provided
-        if crawl_state:
-            crawl_state.set_page(
-                file_path=file_path,
-                url=url,
-                content_hash=content_hash,
-                title=title,
-                etag=result.get('etag'),
-                last_modified=result.get('last_modified'),
-            )
-
-        # Track for index
-        category = _get_category(file_path)
-        if category not in index_entries:
-            index_entries[category] = []
-        index_entries[category].append((title, f"{file_path}.md", url))
+    # Leave identical files (and their mtimes) alone
+    if _is_up_to_date(out_path, content_hash if ctx.frontmatter else None, data):
+        return title, content_hash, False
 
-    print(f"  Total files written: {files_written}")
-    return files_written, index_entries
+    # Write file (parent directories are created by the caller)
+    with open(out_path, 'wb') as f:
+        f.write(data)
+
+    return title, content_hash, True
+
+
+def _is_up_to_date(out_path: Path, content_hash: Optional[str], data: bytes) -> bool:
+    """
+    Check whether an existing output file already holds a page.
+
+    Args:
+        out_path: Output file path
+        content_hash: Page content hash, compared with the file's frontmatter;
+            None for files without frontmatter (compared byte for byte)
+        data: Encoded file content that would be written
+
+    Returns:
+        True if writing data would not change the page
+    """
+    try:
+        with open(out_path, 'rb') as f:
+            if content_hash is None:
+                return f.read() == data
+            match = CONTENT_HASH_RE.search(f.read(4096))
+    except FileNotFoundError:
+        return False
+
+    return match is not None and match.group(1) == content_hash.encode()
+
+
+def _frontmatter(meta: Dict[str, str]) -> str:
+    """Serialize metadata as a YAML frontmatter block (quotes and escapes as needed)."""
+    body = yaml.dump(
+        meta,
+        Dumper=_YamlDumper,
+        sort_keys=False,
+        allow_unicode=True,
+        width=2**31 - 1,  # never fold long titles
+    )
+    return f"---\n{body}---\n"
 
 
 def _get_category(file_path: str) -> str:
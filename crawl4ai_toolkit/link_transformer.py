@@ -5,11 +5,50 @@ Handles transforming internal documentation links to relative file paths
 while preserving external links and handling edge cases like anchors.
 """
 
+import posixpath
 import re
+from functools import lru_cache
 from urllib.parse import urlparse, urljoin
-from typing import Callable, Set, Optional
+from typing import Callable, Collection, Dict, Iterable, Optional
 
 
+# Match markdown links: [text](url) or [text](url "title") or [text](url 'title')
+# Link text stops at '[' as well as ']', so a run of unclosed brackets is
+# scanned once instead of once per bracket (the innermost '[' still starts
+# the match, and the text before it is copied through unchanged).
+LINK_PATTERN = re.compile(r"""
+    \[ ( [^\[\]]* ) \]          # group 1: link text
+    \( ( [^\s)]+ )               # group 2: URL (may include fragment)
+    (?: \s+ (?: "[^"]*" | '[^']*' ) )?   # optional title, stripped
+    \)
+""", re.VERBOSE)
+
+# URL scheme as urlsplit recognizes it, and the '//host' part following it
+_URL_SCHEME_RE = re.compile(r'[A-Za-z][A-Za-z0-9+.-]*:')
+_NETLOC_RE = re.compile(r'//([^/?#]*)')
+
+
+def build_crawled_index(crawled_urls: Iterable[str]) -> Dict[str, str]:
+    """
+    Index crawled URLs by their trailing-slash-free form.
+
+    Build once per generation run and pass to transform_links for
+    every page instead of re-indexing the crawled URLs per page.
+
+    Both trailing-slash variants of a URL map to the same key, so one
+    dict lookup resolves them. Links to uncrawled URLs are kept as-is
+    rather than matched to a crawled prefix (e.g. a parent page).
+
+    Args:
+        crawled_urls: URLs that were crawled
+
+    Returns:
+        Dict mapping normalized URL to the crawled URL
+    """
+    return {crawled_url.rstrip('/'): crawled_url for crawled_url in crawled_urls}
+
+
+@lru_cache(maxsize=200_000)
 def compute_relative_path(from_path: str, to_path: str) -> str:
     """
     Compute the relative path from one file to another.
@@ -25,32 +64,16 @@ def compute_relative_path(from_path: str, to_path: str) -> str:
         compute_relative_path("en-US/docs/Web/API/Animation", "en-US/docs/Web/API/Element")
         => "../Element.md"
     """
-    from_parts = from_path.split('/')
-    to_parts = to_path.split('/')
-
-    # Find common prefix
-    common_length = 0
-    for i in range(min(len(from_parts) - 1, len(to_parts) - 1)):
-        if from_parts[i] == to_parts[i]:
-            common_length = i + 1
-        else:
-            break
-
-    # Calculate path components
-    # Number of directories to go up (from file's directory, not the file itself)
-    ups = len(from_parts) - 1 - common_length
+    # Relative from the source's directory to the target's directory, so a
+    # target file named like a directory on the source's path stays a file
+    to_dir, _, to_name = to_path.rpartition('/')
+    rel_dir = posixpath.relpath(to_dir or '.', posixpath.dirname(from_path) or '.')
 
-    # Remaining path to target
-    remaining = to_parts[common_length:]
-
-    if ups == 0 and not remaining:
+    if rel_dir == '.':
         # Same directory, different file
-        return f"{to_parts[-1]}.md"
-
-    # Build relative path
-    rel_parts = ['..'] * ups + remaining
+        return f"{to_name}.md"
 
-    return '/'.join(rel_parts) + '.md'
+    return f"{rel_dir}/{to_name}.md"
 
 
 def is_internal_link(url: str, base_url: str) -> bool:
@@ -61,25 +84,38 @@ def is_internal_link(url: str, base_url: str) -> bool:
         url: The URL to check
         base_url: The base URL of the documentation site
 
+    Returns:
+        True if the URL is internal, False otherwise
+    """
+    return _is_internal_url(url, urlparse(base_url).netloc)
+
+
+def _is_internal_url(url: str, base_netloc: str) -> bool:
+    """
+    is_internal_link against a pre-parsed base host, without urlparse.
+
+    Splits scheme and host the way urlsplit does: the scheme runs up to
+    the first ':' and the host follows a leading '//'.
+
+    Args:
+        url: The URL to check
+        base_netloc: Host (netloc) of the documentation site
+
     Returns:
         True if the URL is internal, False otherwise
     """
     if not url:
         return False
 
-    # Parse URLs
-    parsed_url = urlparse(url)
-    parsed_base = urlparse(base_url)
+    scheme = _URL_SCHEME_RE.match(url)
+    netloc = _NETLOC_RE.match(url, scheme.end() if scheme else 0)
 
     # Absolute URL with same host
-    if parsed_url.netloc:
-        return parsed_url.netloc == parsed_base.netloc
+    if netloc and netloc.group(1):
+        return netloc.group(1) == base_netloc
 
     # Relative URL (starts with / or is path-only)
-    if url.startswith('/') or not parsed_url.scheme:
-        return True
-
-    return False
+    return url.startswith('/') or scheme is None
 
 
 def normalize_url(url: str, base_url: str) -> tuple[str, str]:
@@ -114,8 +150,9 @@ def transform_links(
     content: str,
     current_file_path: str,
     base_url: str,
-    crawled_urls: Set[str],
+    crawled_urls: Collection[str],
     url_to_filepath: Callable[[str], str],
+    crawled_index: Optional[Dict[str, str]] = None,
 ) -> str:
     """
     Transform internal web links to relative markdown file paths.
@@ -124,8 +161,10 @@ def transform_links(
         content: Markdown content with links
         current_file_path: Path of the current file (without .md extension)
         base_url: Base URL of the documentation site
-        crawled_urls: Set of URLs that were crawled (and thus have local files)
+        crawled_urls: URLs that were crawled (and thus have local files);
+            any collection, e.g. results.keys() - no set copy needed
         url_to_filepath: Function to convert URL to file path
+        crawled_index: Optional prebuilt build_crawled_index(crawled_urls)
 
     Returns:
         Content with internal links transformed to relative paths
@@ -137,42 +176,35 @@ def transform_links(
         - Query parameters: ignored for matching
         - Link titles: [text](url "title") - title attribute is stripped
     """
-    # Match markdown links: [text](url) or [text](url "title") or [text](url 'title')
-    # Group 1: link text
-    # Group 2: URL (may include fragment)
-    # Group 3: optional title with quotes (to be stripped)
-    link_pattern = re.compile(r'\[([^\]]*)\]\(([^\s)]+)(?:\s+["\'][^"\']*["\'])?\)')
+    # Crawled URLs keyed by their trailing-slash-free form, for O(1) lookup
+    if crawled_index is None:
+        crawled_index = build_crawled_index(crawled_urls)
 
-    def replace_link(match):
-        link_text = match.group(1)
-        url = match.group(2)
+    # Parse the base host once; absolute URLs on any other host are kept
+    base_netloc = urlparse(base_url).netloc
+    base_origins = (f'http://{base_netloc}', f'https://{base_netloc}')
 
+    def rewrite_link(link_text: str, url: str) -> Optional[str]:
         # Skip non-internal links
-        if not is_internal_link(url, base_url):
-            return match.group(0)
+        if url.startswith(('http://', 'https://')) and not url.startswith(base_origins):
+            return None
+        if not _is_internal_url(url, base_netloc):
+            return None
 
         # Normalize URL and extract fragment
         normalized_url, fragment = normalize_url(url, base_url)
 
-        # Check if this URL was crawled
-        # Try both with and without trailing slash
-        url_found = False
-        matched_url = None
-        for crawled_url in crawled_urls:
-            crawled_normalized = crawled_url.rstrip('/')
-            if normalized_url == crawled_normalized:
-                url_found = True
-                matched_url = crawled_url
-                break
-
-        if not url_found:
+        # Check if this URL was crawled (with or without trailing slash)
+        matched_url = crawled_index.get(normalized_url)
+
+        if matched_url is None:
             # URL not crawled, keep original link
-            return match.group(0)
+            return None
 
         # Get target file path
         target_path = url_to_filepath(matched_url)
         if not target_path:
-            return match.group(0)
+            return None
 
         # Compute relative path
         relative_path = compute_relative_path(current_file_path, target_path)
@@ -183,4 +215,18 @@ def transform_links(
 
         return f'[{link_text}]({relative_path})'
 
-    return link_pattern.sub(replace_link, content)
+    # Single pass: copy unchanged spans, substitute only rewritten links
+    parts = []
+    last = 0
+    for match in LINK_PATTERN.finditer(content):
+        rewritten = rewrite_link(match.group(1), match.group(2))
+        if rewritten is not None:
+            parts.append(content[last:match.start()])
+            parts.append(rewritten)
+            last = match.end()
+
+    if not parts:
+        return content
+
+    parts.append(content[last:])
+    return ''.join(parts)
@@ -6,35 +6,248 @@ using a multi-level strategy: HTTP headers (ETag/Last-Modified) first,
 then content hash as fallback.
 """
 
+import asyncio
+import gzip
 import json
 import hashlib
+import mmap
+import os
+import zlib
+from concurrent.futures import ProcessPoolExecutor
 import aiohttp
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Optional, List, Callable, Any
+from typing import Dict, Optional, List, Callable, Tuple, Any, Union
 from dataclasses import dataclass, asdict
 
+try:  # Optional: orjson (de)serializes the state file several times faster
+    import orjson
+except ImportError:
+    orjson = None
 
-def compute_content_hash(content: str) -> str:
+try:  # Optional: zstandard compresses the state file faster than gzip
+    import zstandard as _zstd
+except ImportError:
+    _zstd = None
+
+try:
+    from blake3 import blake3 as _blake3
+except ImportError:  # blake3 not installed: hashlib's SHA-256 only
+    _blake3 = None
+
+# Hashers by name; hashes are written with HASH_ALGORITHM and compared
+# using the algorithm recorded in the saved hash
+_HASHERS: Dict[str, Callable[[], Any]] = {'sha256': hashlib.sha256}
+if _blake3 is not None:
+    _HASHERS['blake3'] = _blake3
+
+HASH_ALGORITHM = 'blake3' if _blake3 is not None else 'sha256'
+
+# Byte values str.strip() removes that bytes.strip() handles the same way,
+# and byte values that can start or end any other whitespace character
+_ASCII_WHITESPACE = frozenset(b' \t\n\r\x0b\x0c')
+_OTHER_WHITESPACE_LEAD = frozenset(range(0x1c, 0x20)) | frozenset(range(0x80, 0x100))
+
+# Page files at least this large are memory-mapped rather than read
+_MMAP_MIN_SIZE = 1 << 20
+
+
+def hash_algorithm(saved_hash: Optional[str] = None) -> str:
     """
-    Compute SHA256 hash of content.
+    Pick the algorithm to hash with.
+
+    Saved hashes carry their algorithm as a prefix ("sha256:..."), so
+    content compared against a saved hash is rehashed the same way and
+    older state keeps matching; new hashes use HASH_ALGORITHM.
 
     Args:
-        content: The content to hash
+        saved_hash: Hash to compare against, if any
+
+    Returns:
+        The saved hash's algorithm if available, else HASH_ALGORITHM
+    """
+    if saved_hash:
+        algorithm = saved_hash.partition(':')[0]
+        if algorithm in _HASHERS:
+            return algorithm
+    return HASH_ALGORITHM
+
+
+def _digest(parts: Tuple[bytes, ...], algorithm: Optional[str]) -> str:
+    """Hash parts in order and format as "<algorithm>:<16 hex chars>"."""
+    algorithm = algorithm or HASH_ALGORITHM
+    h = _HASHERS[algorithm]()
+    for part in parts:
+        h.update(part)
+    return f"{algorithm}:{h.hexdigest()[:16]}"
+
+
+def compute_content_hash(
+    content: Union[str, bytes, bytearray, memoryview],
+    algorithm: Optional[str] = None,
+) -> str:
+    """
+    Compute hash of content.
+
+    Args:
+        content: The content to hash; text is hashed as UTF-8, and UTF-8
+            bytes (e.g. read from a page file) are hashed without a copy
+        algorithm: Hash algorithm (defaults to HASH_ALGORITHM; see hash_algorithm)
+
+    Returns:
+        Hash string in format "<algorithm>:<first 16 chars of hex digest>"
+    """
+    data = content.encode() if isinstance(content, str) else content
+    return _digest((data,), algorithm)
+
+
+def compute_page_hash(title: str, markdown: str, algorithm: Optional[str] = None) -> str:
+    """
+    Compute the content hash of a generated page body.
+
+    Same result as compute_content_hash(f"# {title}\n\n{markdown}"), fed
+    to the hasher piecewise instead of building the full page string.
+
+    Args:
+        title: Page title
+        markdown: Cleaned markdown content
+        algorithm: Hash algorithm (defaults to HASH_ALGORITHM)
+
+    Returns:
+        Hash string in the same format as compute_content_hash
+    """
+    return _digest((b"# ", title.encode(), b"\n\n", markdown.encode()), algorithm)
+
+
+def compute_raw_hash(
+    markdown: str,
+    title: str,
+    algorithm: Optional[str] = None,
+    fingerprint: str = "",
+) -> str:
+    """
+    Compute hash of a page's raw (uncleaned) markdown and title.
+
+    Lets change detection skip cleaning when the crawled page is
+    byte-identical to the one that was last written with the same
+    cleaning and output settings.
+
+    Args:
+        markdown: Raw markdown as returned by the crawler
+        title: Raw page title from metadata
+        algorithm: Hash algorithm (defaults to HASH_ALGORITHM)
+        fingerprint: Fingerprint of the settings the page was generated
+            with (see generator.generation_fingerprint)
+
+    Returns:
+        Hash string in the same format as compute_content_hash
+    """
+    parts = (markdown.encode(), b"\0", title.encode())
+    if fingerprint:
+        parts += (b"\0", fingerprint.encode())
+    return _digest(parts, algorithm)
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON from UTF-8 bytes, with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any, indent: Optional[int] = None) -> bytes:
+    """Serialize to UTF-8 JSON bytes, with orjson when available."""
+    if orjson is not None and indent in (None, 2):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=indent, ensure_ascii=False).encode('utf-8')
+
+
+# Suffix added to the state file name for each compression format
+_ZSTD_SUFFIX = '.zst'
+_GZIP_SUFFIX = '.gz'
+
+# Raised by _decompress on truncated or corrupt data (bad gzip headers
+# raise gzip.BadGzipFile, an OSError)
+_DECOMPRESS_ERRORS: Tuple[type, ...] = (EOFError, zlib.error)
+if _zstd is not None:
+    _DECOMPRESS_ERRORS += (_zstd.ZstdError,)
+
+
+def _compress(data: bytes) -> Tuple[bytes, str]:
+    """
+    Compress state file bytes with zstd when available, else gzip.
 
     Returns:
-        Hash string in format "sha256:<first 16 chars of hex digest>"
+        (compressed bytes, file name suffix for the format)
     """
-    return f"sha256:{hashlib.sha256(content.encode()).hexdigest()[:16]}"
+    if _zstd is not None:
+        return _zstd.ZstdCompressor(level=3).compress(data), _ZSTD_SUFFIX
+    return gzip.compress(data, compresslevel=6, mtime=0), _GZIP_SUFFIX
+
+
+def _decompress(data: bytes, path: Path) -> bytes:
+    """Decompress state file bytes according to the file's suffix (plain JSON is returned as is)."""
+    if path.suffix == _ZSTD_SUFFIX:
+        if _zstd is None:
+            raise RuntimeError(f"{path} is zstd-compressed: install zstandard to read it")
+        return _zstd.ZstdDecompressor().decompress(data)
+    if path.suffix == _GZIP_SUFFIX:
+        return gzip.decompress(data)
+    return data
 
 
-@dataclass
+def _shorten_urls(state: dict) -> dict:
+    """
+    Return state for saving with the page URLs' common prefix factored out.
+
+    Pages of a source share a long URL prefix (scheme, host, docs path):
+    it is stored once as "url_prefix" and each page keeps only the rest of
+    its URL. The state itself is not modified.
+    """
+    pages = state.get("pages")
+    urls = [page["url"] for page in pages.values() if page.get("url")] if pages else []
+    # Cut at a "/" so the stored suffixes stay readable paths, and keep
+    # every suffix non-empty so pages without a URL stay distinguishable
+    prefix = os.path.commonprefix(urls)
+    prefix = prefix[:prefix.rfind('/') + 1]
+    if prefix in urls:
+        prefix = prefix[:prefix.rfind('/', 0, -1) + 1]
+    if not prefix:
+        return state
+
+    cut = len(prefix)
+    return dict(
+        state,
+        url_prefix=prefix,
+        pages={
+            file_path: dict(page, url=page["url"][cut:]) if page.get("url") else page
+            for file_path, page in pages.items()
+        },
+    )
+
+
+def _expand_urls(state: dict) -> dict:
+    """Undo _shorten_urls on loaded state (in place); older state is returned as is."""
+    prefix = state.pop("url_prefix", None)
+    if prefix:
+        for page in state.get("pages", {}).values():
+            if page.get("url"):
+                page["url"] = prefix + page["url"]
+    return state
+
+
+@dataclass(frozen=True, slots=True)
 class ChangeResult:
-    """Result of checking if a page has changed."""
+    """
+    Result of checking if a page has changed.
+
+    status is one of four string literals, so grouping results by status
+    is a dict lookup on interned strings (see print_change_report).
+    """
     url: str
     file_path: str
     status: str  # 'unchanged', 'changed', 'new', 'removed'
-    reason: str  # 'etag', 'last_modified', 'content_hash', 'new_page', 'missing_file', 'local_modified'
+    reason: str  # 'etag', 'last_modified', 'content_hash', 'raw_hash', 'new_page', 'missing_file', 'local_modified'
 
     def to_dict(self) -> dict:
         return asdict(self)
@@ -48,24 +261,48 @@ class CrawlState:
     HTTP headers for change detection.
     """
 
-    def __init__(self, source_dir: Path):
+    def __init__(self, source_dir: Path, compress: bool = False):
         """
         Initialize CrawlState for a source directory.
 
         Args:
             source_dir: Path to the source directory (e.g., sources/mdn-web-animations-api)
+            compress: Whether save() compresses the state file, written as
+                .crawl-state.json.zst (zstd installed) or .json.gz; any of
+                the three files is read back transparently
+
+        Raises:
+            RuntimeError: If the state file is zstd-compressed and zstandard
+                is not installed
         """
         self.source_dir = source_dir
-        self.state_file = source_dir / ".crawl-state.json"
+        self.compress = compress
+        self.state_file = self._find_state_file()
+        # Page changes since the last save, one JSON object per line
+        self.log_file = source_dir / ".crawl-state.log"
+        self._log = None
         self.state = self._load()
+        self._replay_log()
+
+    def _state_files(self) -> List[Path]:
+        """Possible state file paths: plain JSON, then compressed."""
+        plain = self.source_dir / ".crawl-state.json"
+        return [plain] + [plain.with_name(plain.name + suffix) for suffix in (_ZSTD_SUFFIX, _GZIP_SUFFIX)]
+
+    def _find_state_file(self) -> Path:
+        """Return the existing state file (the newest, if several), else the plain JSON path."""
+        existing = [path for path in self._state_files() if path.exists()]
+        if not existing:
+            return self._state_files()[0]
+        return max(existing, key=lambda path: path.stat().st_mtime_ns)
 
     def _load(self) -> dict:
         """Load state from file or return empty state."""
         if self.state_file.exists():
             try:
-                with open(self.state_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
+                with open(self.state_file, 'rb') as f:
+                    return _expand_urls(_json_loads(_decompress(f.read(), self.state_file)))
+            except (json.JSONDecodeError, IOError, *_DECOMPRESS_ERRORS) as e:
                 print(f"  Warning: Could not load state file: {e}")
                 return self._empty_state()
         return self._empty_state()
@@ -80,11 +317,44 @@ class CrawlState:
             "pages": {}
         }
 
-    def save(self) -> None:
-        """Save state to file."""
+    def save(self, indent: Optional[int] = None) -> None:
+        """
+        Save state to file.
+
+        Writes a temporary file and renames it over the state file, so an
+        interrupted save leaves the previous state intact. The saved
+        snapshot includes every logged page change, so the log is then
+        cleared. State files in other formats (from an earlier compress
+        setting) are removed.
+
+        Args:
+            indent: Optional JSON indentation (compact by default)
+        """
         self.state["last_crawl"] = datetime.now().isoformat()
-        with open(self.state_file, 'w', encoding='utf-8') as f:
-            json.dump(self.state, f, indent=2, ensure_ascii=False)
+        data = _json_dumps(_shorten_urls(self.state), indent)
+        state_file = self._state_files()[0]
+        if self.compress:
+            data, suffix = _compress(data)
+            state_file = state_file.with_name(state_file.name + suffix)
+
+        tmp_file = state_file.with_name(state_file.name + '.tmp')
+        with open(tmp_file, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_file, state_file)
+        self.state_file = state_file
+
+        for path in self._state_files():
+            if path != state_file:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+
+        self.close()
+        try:
+            os.remove(self.log_file)
+        except FileNotFoundError:
+            pass
 
     def get_page(self, file_path: str) -> Optional[dict]:
         """
@@ -106,6 +376,7 @@ class CrawlState:
         title: str = "",
         etag: Optional[str] = None,
         last_modified: Optional[str] = None,
+        raw_hash: Optional[str] = None,
     ) -> None:
         """
         Save state for a page.
@@ -113,15 +384,16 @@ class CrawlState:
         Args:
             file_path: Relative file path (without .md extension)
             url: Page URL
-            content_hash: SHA256 hash of content
+            content_hash: Hash of content (see compute_page_hash)
             title: Page title
             etag: ETag header value
             last_modified: Last-Modified header value
+            raw_hash: Hash of the raw markdown and title (see compute_raw_hash)
         """
         if "pages" not in self.state:
             self.state["pages"] = {}
 
-        self.state["pages"][file_path] = {
+        page = {
             "url": url,
             "content_hash": content_hash,
             "title": title,
@@ -129,17 +401,74 @@ class CrawlState:
         }
 
         if etag:
-            self.state["pages"][file_path]["etag"] = etag
-            self.state["supports_etag"] = True
+            page["etag"] = etag
 
         if last_modified:
-            self.state["pages"][file_path]["last_modified"] = last_modified
+            page["last_modified"] = last_modified
+
+        if raw_hash:
+            page["raw_hash"] = raw_hash
+
+        self._apply_set(file_path, page)
+        self._append_log({"op": "set", "file_path": file_path, "page": page})
+
+    def _apply_set(self, file_path: str, page: dict) -> None:
+        """Store a page's state and record header support."""
+        self.state.setdefault("pages", {})[file_path] = page
+
+        if "etag" in page:
+            self.state["supports_etag"] = True
+
+        if "last_modified" in page:
             self.state["supports_last_modified"] = True
 
     def remove_page(self, file_path: str) -> None:
         """Remove a page from state."""
         if "pages" in self.state and file_path in self.state["pages"]:
             del self.state["pages"][file_path]
+            self._append_log({"op": "remove", "file_path": file_path})
+
+    def close(self) -> None:
+        """Close the change log (unsaved changes stay in it for the next load)."""
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+    def __enter__(self) -> "CrawlState":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        self.close()
+
+    def _append_log(self, entry: dict) -> None:
+        """Record a page change in the log until the next save."""
+        if self._log is None:
+            # Unbuffered: each entry reaches the OS as soon as it is logged,
+            # so it survives the process being killed
+            self._log = open(self.log_file, 'ab', buffering=0)
+        self._log.write(_json_dumps(entry) + b'\n')
+
+    def _replay_log(self) -> None:
+        """Apply page changes logged after the last save (e.g. before a crash)."""
+        try:
+            with open(self.log_file, 'rb') as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return
+
+        for line in lines:
+            try:
+                entry = _json_loads(line)
+            except ValueError:
+                break  # torn final write
+
+            if entry.get("op") == "set":
+                self._apply_set(entry["file_path"], entry["page"])
+            elif entry.get("op") == "remove":
+                self.state.get("pages", {}).pop(entry["file_path"], None)
 
     def get_all_pages(self) -> Dict[str, dict]:
         """Get all pages in state."""
@@ -155,29 +484,43 @@ class CrawlState:
         return len(self.state.get("pages", {}))
 
 
-async def check_headers(url: str, timeout: int = 10) -> dict:
+def open_http_session() -> aiohttp.ClientSession:
+    """
+    Create an HTTP session for header checks.
+
+    Connections are kept alive and DNS answers cached, so checking many
+    pages of one site costs about one handshake per connection.
+
+    Returns:
+        New aiohttp.ClientSession (use as an async context manager)
+    """
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit_per_host=8, ttl_dns_cache=300),
+        cookie_jar=aiohttp.DummyCookieJar(),
+    )
+
+
+async def check_headers(
+    url: str,
+    timeout: int = 10,
+    session: Optional[aiohttp.ClientSession] = None,
+) -> dict:
     """
     Make HEAD request to get ETag/Last-Modified headers.
 
     Args:
         url: URL to check
         timeout: Request timeout in seconds
+        session: Optional shared session (a temporary one is opened if None)
 
     Returns:
         Dict with 'etag', 'last_modified', 'status' keys
     """
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.head(
-                url,
-                allow_redirects=True,
-                timeout=aiohttp.ClientTimeout(total=timeout)
-            ) as resp:
-                return {
-                    'etag': resp.headers.get('ETag'),
-                    'last_modified': resp.headers.get('Last-Modified'),
-                    'status': resp.status
-                }
+        if session is None:
+            async with open_http_session() as session:
+                return await _head(session, url, timeout)
+        return await _head(session, url, timeout)
     except Exception as e:
         return {
             'etag': None,
@@ -187,24 +530,105 @@ async def check_headers(url: str, timeout: int = 10) -> dict:
         }
 
 
+async def _head(session: aiohttp.ClientSession, url: str, timeout: int) -> dict:
+    """HEAD url on session and return its ETag/Last-Modified headers."""
+    async with session.head(
+        url,
+        allow_redirects=True,
+        timeout=aiohttp.ClientTimeout(total=timeout)
+    ) as resp:
+        return {
+            'etag': resp.headers.get('ETag'),
+            'last_modified': resp.headers.get('Last-Modified'),
+            'status': resp.status
+        }
+
+
+async def not_modified_reason(
+    url: str,
+    saved_state: dict,
+    session: Optional[aiohttp.ClientSession] = None,
+    timeout: int = 10,
+) -> Optional[str]:
+    """
+    Ask the server whether a page changed since it was saved.
+
+    Sends a HEAD with the page's saved ETag/Last-Modified as
+    If-None-Match / If-Modified-Since; an unchanged page costs one round
+    trip with an empty 304 response. Servers that ignore conditional
+    headers are still recognized by echoing the saved validator.
+
+    Args:
+        url: Page URL
+        saved_state: Saved page state with 'etag' and/or 'last_modified'
+        session: Optional shared session (a temporary one is opened if None)
+        timeout: Request timeout in seconds
+
+    Returns:
+        'etag' or 'last_modified' if the page is unchanged, None if it
+        changed, has no saved validator or could not be checked
+    """
+    etag = saved_state.get('etag')
+    last_modified = saved_state.get('last_modified')
+    if not (etag or last_modified):
+        return None
+
+    headers = {}
+    if etag:
+        headers['If-None-Match'] = etag
+    if last_modified:
+        headers['If-Modified-Since'] = last_modified
+
+    async def fetch(session: aiohttp.ClientSession) -> Optional[str]:
+        async with session.head(
+            url,
+            headers=headers,
+            allow_redirects=True,
+            timeout=aiohttp.ClientTimeout(total=timeout)
+        ) as resp:
+            if resp.status == 304:
+                return 'etag' if etag else 'last_modified'
+            if resp.status == 200:
+                if etag and resp.headers.get('ETag') == etag:
+                    return 'etag'
+                if last_modified and resp.headers.get('Last-Modified') == last_modified:
+                    return 'last_modified'
+        return None
+
+    try:
+        if session is None:
+            async with open_http_session() as session:
+                return await fetch(session)
+        return await fetch(session)
+    except (aiohttp.ClientError, asyncio.TimeoutError):
+        return None
+
+
 async def check_page_changed(
     url: str,
     file_path: str,
     saved_state: Optional[dict],
     crawler_func: Optional[Callable] = None,
+    session: Optional[aiohttp.ClientSession] = None,
 ) -> ChangeResult:
     """
     Check if a page has changed using multi-level strategy.
 
     Strategy:
-    1. Try ETag/Last-Modified (HEAD request) - fastest
+    1. Conditional HEAD with the saved ETag/Last-Modified - a 304 (or
+       matching headers) means unchanged; skipped without saved validators
     2. Fallback to content hash (requires full crawl)
 
+    The conditional request (see not_modified_reason) is a HEAD: a
+    changed page's HTML could not be hashed against the saved markdown
+    hash anyway, so downloading it would only duplicate the crawl in step 2.
+
     Args:
         url: Page URL
         file_path: Relative file path
         saved_state: Previously saved state for this page
         crawler_func: Optional async function to crawl page for content hash comparison
+        session: Optional shared HTTP session for the conditional request
 
     Returns:
         ChangeResult indicating if page changed
@@ -213,25 +637,18 @@ async def check_page_changed(
     if saved_state is None:
         return ChangeResult(url, file_path, 'new', 'new_page')
 
-    # Level 1: Check HTTP headers
-    headers = await check_headers(url)
-
-    # Check ETag
-    if headers.get('etag') and saved_state.get('etag'):
-        if headers['etag'] == saved_state['etag']:
-            return ChangeResult(url, file_path, 'unchanged', 'etag')
-
-    # Check Last-Modified
-    if headers.get('last_modified') and saved_state.get('last_modified'):
-        if headers['last_modified'] == saved_state['last_modified']:
-            return ChangeResult(url, file_path, 'unchanged', 'last_modified')
+    # Level 1: Conditional request (needs a saved validator to compare with)
+    reason = await not_modified_reason(url, saved_state, session=session)
+    if reason:
+        return ChangeResult(url, file_path, 'unchanged', reason)
 
     # Level 2: Content hash (requires full crawl)
     if crawler_func:
         result = await crawler_func(url)
         if result and result.get('markdown'):
-            new_hash = compute_content_hash(result['markdown'])
-            if new_hash == saved_state.get('content_hash'):
+            saved_hash = saved_state.get('content_hash')
+            new_hash = compute_content_hash(result['markdown'], hash_algorithm(saved_hash))
+            if new_hash == saved_hash:
                 return ChangeResult(url, file_path, 'unchanged', 'content_hash')
             return ChangeResult(url, file_path, 'changed', 'content_hash')
 
@@ -239,6 +656,84 @@ async def check_page_changed(
     return ChangeResult(url, file_path, 'changed', 'content_hash')
 
 
+async def check_pages_changed_bulk(
+    pages: List[Tuple[str, str, Optional[dict]]],
+    crawler_func: Optional[Callable] = None,
+    concurrency: int = 16,
+    session: Optional[aiohttp.ClientSession] = None,
+) -> List[ChangeResult]:
+    """
+    Check many pages concurrently over one HTTP session.
+
+    Args:
+        pages: (url, file_path, saved_state) tuples
+        crawler_func: Optional async function to crawl page for content hash comparison
+        concurrency: Maximum number of pages checked at once
+        session: Optional shared HTTP session (one is opened if None)
+
+    Returns:
+        ChangeResult for each page, in input order
+    """
+    if session is None:
+        async with open_http_session() as session:
+            return await check_pages_changed_bulk(pages, crawler_func, concurrency, session)
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def check(url: str, file_path: str, saved_state: Optional[dict]) -> ChangeResult:
+        async with semaphore:
+            return await check_page_changed(url, file_path, saved_state, crawler_func, session)
+
+    return list(await asyncio.gather(*(check(*page) for page in pages)))
+
+
+def _markdown_body(data) -> memoryview:
+    """
+    Extract the markdown after a page file's frontmatter, for hashing.
+
+    Works on the UTF-8 bytes as read, without decoding: the delimiters
+    are ASCII, so byte offsets give the same split as the decoded text.
+    The hash should be of the markdown content, not the full file with
+    frontmatter.
+
+    Args:
+        data: Raw file content (bytes or a read-only mmap)
+
+    Returns:
+        View of the markdown content (stripped when after frontmatter)
+    """
+    # Same newline translation as reading in text mode
+    if data.find(b'\r') != -1:
+        data = bytes(data).replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+
+    if data[:3] != b'---':
+        return memoryview(data)
+
+    # Find end of frontmatter
+    end_idx = data.find(b'---', 3)
+    if end_idx == -1:
+        return memoryview(data)
+
+    # Skip frontmatter and the following newlines
+    content_start = data.find(b'\n', end_idx + 3)
+    if content_start == -1:
+        return memoryview(data)
+
+    body = memoryview(data)[content_start:]
+    start, end = 0, len(body)
+    while start < end and body[start] in _ASCII_WHITESPACE:
+        start += 1
+    while end > start and body[end - 1] in _ASCII_WHITESPACE:
+        end -= 1
+
+    # str.strip() also removes non-ASCII whitespace: decode only if the
+    # remaining edges could be such a character
+    if start < end and (body[start] in _OTHER_WHITESPACE_LEAD or body[end - 1] in _OTHER_WHITESPACE_LEAD):
+        return memoryview(bytes(body[start:end]).decode('utf-8').strip().encode())
+
+    return body[start:end]
+
+
 def check_local_file(
     output_dir: Path,
     file_path: str,
@@ -263,28 +758,24 @@ def check_local_file(
 
     # Read file and compute hash
     try:
-        content = full_path.read_text(encoding='utf-8')
-
-        # Extract markdown content after frontmatter for hashing
-        # The hash should be of the markdown content, not the full file with frontmatter
-        if content.startswith('---'):
-            # Find end of frontmatter
-            end_idx = content.find('---', 3)
-            if end_idx != -1:
-                # Skip frontmatter and the following newlines
-                content_start = content.find('\n', end_idx + 3)
-                if content_start != -1:
-                    markdown_content = content[content_start:].strip()
-                else:
-                    markdown_content = content
-            else:
-                markdown_content = content
-        else:
-            markdown_content = content
-
-        current_hash = compute_content_hash(markdown_content)
+        saved_hash = saved_state.get('content_hash')
+        algorithm = hash_algorithm(saved_hash)
 
-        if current_hash == saved_state.get('content_hash'):
+        with open(full_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < _MMAP_MIN_SIZE:
+                current_hash = compute_content_hash(_markdown_body(f.read()), algorithm)
+            else:
+                # Hash large files straight from the page cache
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    markdown_content = _markdown_body(mm)
+                    try:
+                        current_hash = compute_content_hash(markdown_content, algorithm)
+                    finally:
+                        # Views must go before the mapping can close
+                        markdown_content.release()
+
+        if current_hash == saved_hash:
             return ChangeResult(url, file_path, 'unchanged', 'content_hash')
         else:
             return ChangeResult(url, file_path, 'changed', 'local_modified')
@@ -293,6 +784,42 @@ def check_local_file(
         return ChangeResult(url, file_path, 'removed', f'read_error: {e}')
 
 
+def _check_local_item(item: Tuple[Path, str, dict]) -> ChangeResult:
+    """check_local_file taking one (output_dir, file_path, saved_state) tuple."""
+    return check_local_file(*item)
+
+
+def check_local_files_parallel(
+    output_dir: Path,
+    pages: Dict[str, dict],
+    workers: Optional[int] = None,
+    chunksize: int = 32,
+) -> List[ChangeResult]:
+    """
+    Run check_local_file for many pages across worker processes.
+
+    Reading and hashing files is spread over CPU cores; small page sets
+    are checked in-process, where starting workers would cost more.
+
+    Args:
+        output_dir: Output directory path
+        pages: Saved state per relative file path (as from get_all_pages)
+        workers: Number of worker processes (defaults to the CPU count)
+        chunksize: Pages handed to a worker at a time
+
+    Returns:
+        ChangeResult for each page, in input order
+    """
+    items = [(output_dir, file_path, saved_state) for file_path, saved_state in pages.items()]
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 or len(items) <= chunksize:
+        return [_check_local_item(item) for item in items]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_check_local_item, items, chunksize=chunksize))
+
+
 def print_change_report(
     results: List[ChangeResult],
     source_name: str,
@@ -308,11 +835,16 @@ def print_change_report(
         last_crawl: Timestamp of last crawl
         is_remote: Whether this is a remote check
     """
-    # Categorize results
-    unchanged = [r for r in results if r.status == 'unchanged']
-    changed = [r for r in results if r.status == 'changed']
-    new_pages = [r for r in results if r.status == 'new']
-    removed = [r for r in results if r.status == 'removed']
+    # Categorize results in one pass
+    by_status: Dict[str, List[ChangeResult]] = {
+        'unchanged': [], 'changed': [], 'new': [], 'removed': [],
+    }
+    for r in results:
+        by_status.setdefault(r.status, []).append(r)
+    unchanged = by_status['unchanged']
+    changed = by_status['changed']
+    new_pages = by_status['new']
+    removed = by_status['removed']
 
     check_type = "remote changes" if is_remote else "local files"
     print(f"\nChecking {check_type} for {source_name}...")